@@ -0,0 +1,235 @@
+"""
+Solver benchmarks
+
+Times equationSolver and constraintChecker on representative input
+patterns, microbenchmarks every residual in core.physics on scalars and on
+arrays, and counts residual, gradient and Area-Mach evaluations per solve. Results are
+saved as JSON, and compared against a baseline file when one is given.
+
+    python benchmarks/run.py -o results.json
+    python benchmarks/run.py -o new.json --baseline results.json
+"""
+
+import argparse
+import contextlib
+import functools
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import core.roots as roots
+import core.solver as solver
+
+
+# Chamber conditions shared by every pattern
+chamber = {"P_c": 7e6, "T_c": 3500.0, "M": 0.022, "gamma": 1.2}
+
+# Input patterns
+pattern_dict = {
+    "chamberOnly"   :   {**chamber},                                            # Chamber and throat states
+    "throatExit"    :   {**chamber, "A_t": 0.01, "P_e": 50000.0},               # Exit defined by pressure
+    "fullThrust"    :   {**chamber, "A_t": 0.01, "A_e": 0.1, "P_a": 101325.0},  # Full thrust chain
+    "thrustTarget"  :   {**chamber, "A_t": 0.01, "F": 100000.0, "P_a": 101325.0},  # Coupled exit block
+}
+
+# Cases per array benchmark, chamber pressure swept over a narrow band
+batchSize = 10000
+sweep = (0.95, 1.05)
+
+
+#---------------------------------------------
+# Timer
+#---------------------------------------------
+def timeit(function, repeat):
+    """Best wall time of repeat calls"""
+
+    best = float("inf")
+    function()  # Warm-up, fills the plan caches
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+#---------------------------------------------
+# Evaluation Counter
+#---------------------------------------------
+@contextlib.contextmanager
+def countEvaluations():
+    """
+    Counts residual and gradient calls made through the compiled equations,
+    and areaFunction calls made by the bracketed Area-Mach roots
+    """
+
+    counts = {"residualEvals": 0, "gradientEvals": 0, "areaEvals": 0}
+    original = dict(solver.binding_dict)
+    areaFunction = roots.areaFunction
+
+    # Wrappers keep the function names the inverse registries are keyed by
+    def counted(function, key):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            counts[key] += 1
+            return function(*args, **kwargs)
+        return wrapper
+
+    for eqID, binding in original.items():
+        solver.binding_dict[eqID] = binding._replace(
+            function=counted(binding.function, "residualEvals"),
+            gradient=counted(binding.gradient, "gradientEvals"),
+        )
+    roots.areaFunction = counted(areaFunction, "areaEvals")
+
+    try:
+        yield counts
+    finally:
+        solver.binding_dict.update(original)
+        roots.areaFunction = areaFunction
+
+
+#---------------------------------------------
+# Solver Benchmarks
+#---------------------------------------------
+def solverBenchmarks(repeat):
+    """Scalar and batch solves plus constraint checks per input pattern"""
+
+    results = {}
+    for name, inputVars in pattern_dict.items():
+        batchVars = {**inputVars, "P_c": np.linspace(*sweep, batchSize) * inputVars["P_c"]}
+
+        for label, case in (("scalar", inputVars), ("batch", batchVars)):
+            with countEvaluations() as counts:
+                solver.equationSolver(case)
+
+            results[f"equationSolver/{name}/{label}"] = {
+                "seconds"   :   timeit(lambda: solver.equationSolver(case), repeat),
+                "cases"     :   1 if case is inputVars else batchSize,
+                **counts,
+            }
+
+        results[f"constraintChecker/{name}"] = {
+            "seconds"   :   timeit(lambda: solver.constraintChecker(inputVars), repeat),
+            "cases"     :   1,
+        }
+
+    return results
+
+
+#---------------------------------------------
+# Residual Benchmarks
+#---------------------------------------------
+def residualBenchmarks(repeat):
+    """Every physics residual on scalars and on arrays, evaluated at a solved case"""
+
+    solved = {**pattern_dict["fullThrust"], **solver.constantVars}
+    solved.update(solver.equationSolver(pattern_dict["fullThrust"]))
+
+    results = {}
+    for eqID, binding in solver.binding_dict.items():
+        function = binding.function
+        args = [float(solved[solver.symbol_list[i]]) for i in binding.argIndex]
+        arrays = [np.full(batchSize, arg) for arg in args]
+
+        def scalarLoop():
+            for _ in range(batchSize):
+                function(*args)
+
+        results[f"residual/{eqID}/scalar"] = {"seconds": timeit(scalarLoop, repeat), "cases": batchSize}
+        results[f"residual/{eqID}/array"] = {"seconds": timeit(lambda: function(*arrays), repeat), "cases": batchSize}
+
+    return results
+
+
+#---------------------------------------------
+# Baseline Comparison
+#---------------------------------------------
+def compare(results, baseline, threshold):
+    """Returns the regressions of results against a baseline"""
+
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+
+        # Slower by more than threshold
+        ratio = result["seconds"] / reference["seconds"]
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {ratio:.2f}x slower")
+
+        # Any extra residual, gradient or Area-Mach evaluations
+        for key in ("residualEvals", "gradientEvals", "areaEvals"):
+            if key in reference and result.get(key, 0) > reference[key]:
+                regressions.append(f"{name}: {key} {reference[key]} -> {result[key]}")
+
+    return regressions
+
+
+#---------------------------------------------
+# Report
+#---------------------------------------------
+def report(results, baseline=None):
+    """Prints one line per benchmark, with the change against the baseline"""
+
+    for name, result in results.items():
+        perCase = result["seconds"] / result["cases"] * 1e6
+        line = f"{name:55s} {result['seconds'] * 1e3:10.3f} ms {perCase:10.3f} us/case"
+
+        if "residualEvals" in result:
+            line += f" {result['residualEvals']:6d} res {result['gradientEvals']:6d} grad {result['areaEvals']:6d} area"
+
+        if baseline is not None and name in baseline:
+            line += f" {result['seconds'] / baseline[name]['seconds']:6.2f}x"
+
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solver benchmarks")
+    parser.add_argument("-o", "--output", metavar="JSON", help="file to save results to")
+    parser.add_argument("--baseline", metavar="JSON", help="saved results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="slowdown flagged as a regression")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark, best is kept")
+    parser.add_argument("--skip-residuals", action="store_true", help="only run the solver benchmarks")
+    args = parser.parse_args(argv)
+
+    results = solverBenchmarks(args.repeat)
+    if not args.skip_residuals:
+        results.update(residualBenchmarks(args.repeat))
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+    report(results, baseline)
+
+    if args.output:
+        meta = {
+            "python"    :   platform.python_version(),
+            "numpy"     :   np.__version__,
+            "machine"   :   platform.machine(),
+            "time"      :   time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        with open(args.output, "w") as f:
+            json.dump({"meta": meta, "results": results}, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,10 +10,41 @@ from .physics import (
 from .solver import (
     equationSolver
 )
-from .units import *
-from .controller import (
-    Controller
+from .roots import (
+    areaMachRoots
+)
+from .nozzle import (
+    nozzleProfile
 )
+from .units import *
+
+# Loaded on first use, keeps core importable without Qt
+lazy_dict = {
+    "Controller"        :   ".controller",
+    "SolveCache"        :   ".cache",
+    "SolverPool"        :   ".parallel",
+    "parallelSolve"     :   ".parallel",
+    "batchSolve"        :   ".batch",
+    "runBatch"          :   ".batch",
+    "standardAtmosphere":   ".atmosphere",
+    "trajectoryProfile" :   ".trajectory",
+    "optimizeDesign"    :   ".optimize",
+    "continuationSolver":   ".sweep",
+    "monteCarlo"        :   ".uncertainty",
+    "sensitivitySolver" :   ".sensitivity",
+}
+
+def __getattr__(name):
+    if name not in lazy_dict:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(lazy_dict[name], __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(lazy_dict))
 
 __all__ = [
     "specificGasConstant", 
@@ -24,4 +55,6 @@ __all__ = [
     "massFlow",
     "thrust",
     "equationSolver",
-]
\ No newline at end of file
+    "areaMachRoots",
+    "nozzleProfile",
+]
@@ -0,0 +1,127 @@
+#U.S. Standard Atmosphere, 1976
+import numpy
+
+
+# Model constants
+g_0         =   9.80665         #Standard Gravity                       [m/s²]
+r_0         =   6356766.0       #Effective Earth Radius                 [m]
+R_star      =   8.31432         #Gas Constant Of The 1976 Model         [J⋅K^−1⋅mol^−1]
+M_0         =   0.0289644       #Sea Level Molar Mass Of Air            [kg/mol]
+
+# Layer base geopotential altitude [m] : temperature lapse rate [K/m]
+layer_dict = {
+    0.0         :   -0.0065,
+    11000.0     :   0.0,
+    20000.0     :   0.001,
+    32000.0     :   0.0028,
+    47000.0     :   0.0,
+    51000.0     :   -0.0028,
+    71000.0     :   -0.002,
+    84852.0     :   0.0,
+}
+
+# Sea level base values
+T_0         =   288.15          #[K]
+P_0         =   101325.0        #[Pa]
+
+# Table geometric altitude range and spacing [m]
+tableRange  =   (-5000.0, 86000.0)
+tableStep   =   10.0
+
+
+#---------------------------------------------
+# Layer Model
+#---------------------------------------------
+def geopotentialAltitude(z):
+    """H = r_0 * z / (r_0 + z)"""
+    return r_0 * z / (r_0 + z)
+
+
+def layerBases():
+    """Base (H, T, P, lapse) of every layer, integrated up from sea level"""
+    bases = []
+    T_b, P_b = T_0, P_0
+    heights = list(layer_dict)
+
+    for i, H in enumerate(heights):
+        lapse = layer_dict[H]
+        bases.append((H, T_b, P_b, lapse))
+
+        if i + 1 < len(heights):
+            T_b, P_b = layerState(heights[i + 1], H, T_b, P_b, lapse)
+
+    return bases
+
+
+def layerState(H, H_b, T_b, P_b, lapse):
+    """Temperature and pressure at H within the layer based at H_b"""
+    T = T_b + lapse * (H - H_b)
+
+    with numpy.errstate(divide="ignore"):
+        if lapse == 0:
+            P = P_b * numpy.exp(-g_0 * M_0 * (H - H_b) / (R_star * T_b))
+        else:
+            P = P_b * (T_b / T) ** (g_0 * M_0 / (R_star * lapse))
+
+    return T, P
+
+
+def modelState(z):
+    """Exact model temperature, pressure and density at geometric altitudes z"""
+    z = numpy.asarray(z, dtype=float)
+    H = geopotentialAltitude(z)
+    T = numpy.empty(z.shape)
+    P = numpy.empty(z.shape)
+
+    # The first layer also extends below sea level
+    bases = layerBases()
+    layer = numpy.searchsorted([b[0] for b in bases], H, side="right") - 1
+    layer = numpy.maximum(layer, 0)
+
+    for i, (H_b, T_b, P_b, lapse) in enumerate(bases):
+        inLayer = layer == i
+        T[inLayer], P[inLayer] = layerState(H[inLayer], H_b, T_b, P_b, lapse)
+
+    return T, P, P * M_0 / (R_star * T)
+
+
+#---------------------------------------------
+# Precomputed Table
+#---------------------------------------------
+tableAltitude = numpy.arange(tableRange[0], tableRange[1] + tableStep / 2, tableStep)
+tableTemperature, tablePressure, tableDensity = modelState(tableAltitude)
+
+# Pressure and density are interpolated in log space, they vary exponentially
+tableLogPressure = numpy.log(tablePressure)
+tableLogDensity = numpy.log(tableDensity)
+
+
+#---------------------------------------------
+# Lookups
+#---------------------------------------------
+def standardAtmosphere(z):
+    """
+    Temperature, pressure and density at geometric altitudes z
+
+    Interpolates the precomputed table, so whole arrays of altitudes cost
+    one np.interp per property. z is in m. Above the table the isothermal
+    top layer is extended, so P and rho decay toward vacuum, and altitudes
+    below it give NaN. Returns a dict of T [K], P [Pa] and rho [kg/m³].
+    """
+    return {
+        "T"     :   numpy.interp(z, tableAltitude, tableTemperature, left=numpy.nan),
+        "P"     :   ambientPressure(z),
+        "rho"   :   numpy.exp(logInterp(z, tableLogDensity)),
+    }
+
+
+def ambientPressure(z):
+    """Pressure [Pa] at geometric altitudes z [m], decaying toward vacuum above tableRange and NaN below it"""
+    return numpy.exp(logInterp(z, tableLogPressure))
+
+
+def logInterp(z, table):
+    """Interpolates a log-space column, extending its last segment linearly above the table"""
+    value = numpy.interp(z, tableAltitude, table, left=numpy.nan)
+    slope = (table[-1] - table[-2]) / (tableAltitude[-1] - tableAltitude[-2])
+    return value + slope * numpy.maximum(numpy.asarray(z, dtype=float) - tableAltitude[-1], 0)
@@ -0,0 +1,182 @@
+import csv
+import sys
+from itertools import islice
+
+import numpy as np
+
+from .solver import equationSolver, symbol_list, constantVars
+from .units import toSI, fromSI, parseColumn, unitFactors
+from .gases import mixtureInputs
+
+
+#---------------------------------------------
+# Batch Solve
+#---------------------------------------------
+def batchSolve(inStream, outStream, chunkSize=1024, branch="supersonic", pool=None, cache=None, mixture=None):
+    """
+    Solves design cases streamed from CSV, one row per case
+
+    Columns named by symbols (P_c, T_c, A_t, gamma, ...) are inputs, empty
+    cells are unknown, and any other columns are passed through untouched.
+    A symbol column may carry a unit, as in P_c[psi], in which case its
+    values are read and written in that unit, otherwise in SI.
+    Rows are read chunkSize at a time, cases with the same given symbols are
+    solved together in one vectorized pass, and results are written row by
+    row in input order with every symbol as a column. Each group is split
+    across the worker processes of pool when one is given, and only cases
+    missing from cache are solved when one is given. With a mixture, gamma
+    and M left empty are looked up from its gas property table.
+
+    Returns the number of cases solved.
+    """
+
+    reader = csv.DictReader(inStream)
+    inputColumns = list(reader.fieldnames or [])
+    columns = symbolColumns(inputColumns)
+    outputColumns = inputColumns + [s for s in symbol_list if s not in columns and s not in constantVars]
+
+    writer = csv.DictWriter(outStream, outputColumns)
+    writer.writeheader()
+
+    count = 0
+    while True:
+        rows = list(islice(reader, chunkSize))
+        if not rows:
+            break
+
+        for row in solveChunk(rows, count, branch, pool, cache, columns, mixture):
+            writer.writerow(row)
+        outStream.flush()
+
+        count += len(rows)
+
+    return count
+
+
+#---------------------------------------------
+# Solve Chunk
+#---------------------------------------------
+def solveChunk(rows, offset=0, branch="supersonic", pool=None, cache=None, columns=None, mixture=None):
+    """
+    Solves a chunk of CSV rows, grouping cases by their given symbols
+
+    columns maps symbols to their (column, unit), by default every symbol
+    in its own column in SI. Units are converted a whole group at a time.
+    """
+
+    if columns is None:
+        columns = {symbol: (symbol, None) for symbol in symbol_list}
+
+    cases = [parseRow(row, offset + n + 2, columns) for n, row in enumerate(rows)]
+
+    groups = {}
+    for n, inputVars in enumerate(cases):
+        groups.setdefault(frozenset(inputVars), []).append(n)
+
+    results = [dict(row) for row in rows]
+    for symbols, members in groups.items():
+        inputVars = {
+            symbol: toSI(np.array([cases[n][symbol] for n in members]), columns[symbol][1], symbol)
+            for symbol in symbols
+        }
+
+        # Gas properties from the mixture table are written out with the results
+        mixtureVars = {}
+        if mixture is not None:
+            mixtureVars = {k: v for k, v in mixtureInputs(inputVars, mixture).items() if k not in inputVars}
+            inputVars.update(mixtureVars)
+        if cache is not None:
+            derivedVars = cache.solve(inputVars, branch=branch)
+        elif pool is not None:
+            derivedVars = pool.solve(inputVars, branch=branch)
+        else:
+            derivedVars = equationSolver(inputVars, branch=branch)
+        derivedVars = {**mixtureVars, **derivedVars}
+
+        for symbol, values in derivedVars.items():
+            column, unit = columns.get(symbol, (symbol, None))
+            for n, value in zip(members, fromSI(values, unit, symbol)):
+                results[n][column] = repr(float(value))
+
+    return results
+
+
+#---------------------------------------------
+# Parse Row
+#---------------------------------------------
+def parseRow(row, line, columns):
+    """Returns symbol:value pairs for the non-empty symbol cells of a row, in the column units"""
+
+    inputVars = {}
+    for symbol, (column, _) in columns.items():
+        raw = (row.get(column) or "").strip()
+        if not raw:
+            continue
+
+        # Raises ValueError naming the line and column of a bad cell
+        try:
+            inputVars[symbol] = float(raw)
+        except ValueError:
+            raise ValueError(f"Line {line}: invalid numeric value for {column!r}: {raw}") from None
+
+    return inputVars
+
+
+#---------------------------------------------
+# Symbol Columns
+#---------------------------------------------
+def symbolColumns(names):
+    """Maps the symbols among CSV column names to their (column, unit)"""
+
+    columns = {}
+    for name in names:
+        symbol, unit = parseColumn(name)
+        if symbol not in symbol_list:
+            continue
+
+        # Raises ValueError for unknown or mismatched units and repeated symbols
+        if unit is not None:
+            try:
+                unitFactors(unit, symbol)
+            except ValueError as e:
+                raise ValueError(f"Column {name!r}: {e}") from None
+        if symbol in columns:
+            raise ValueError(f"Columns {columns[symbol][0]!r} and {name!r} both hold {symbol!r}")
+
+        columns[symbol] = (name, unit)
+
+    return columns
+
+
+#---------------------------------------------
+# Batch Entry Point
+#---------------------------------------------
+def runBatch(inPath, outPath="-", chunkSize=1024, branch="supersonic", workers=1, cachePath=None, mixture=None):
+    """Runs batchSolve between files, '-' meaning stdin / stdout"""
+
+    inStream = sys.stdin if inPath == "-" else open(inPath, newline="")
+    outStream = sys.stdout if outPath == "-" else open(outPath, "w", newline="")
+
+    # Process pool and SQLite are only imported when asked for
+    pool = None
+    if workers > 1:
+        from .parallel import SolverPool
+        pool = SolverPool(workers, branch)
+
+    cache = None
+    if cachePath is not None:
+        from .cache import SolveCache
+        solver = equationSolver if pool is None else lambda inputVars, branch: pool.solve(inputVars, branch=branch)
+        cache = SolveCache(path=cachePath, solver=solver)
+
+    try:
+        return batchSolve(inStream, outStream, chunkSize, branch, pool, cache, mixture)
+    finally:
+        if pool is not None:
+            pool.close()
+        if cache is not None:
+            cache.close()
+        if inStream is not sys.stdin:
+            inStream.close()
+        if outStream is not sys.stdout:
+            outStream.close()
@@ -0,0 +1,317 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .solver import equationSolver, eqVars_dict, constantVars, asValue
+from .gases import mixtureInputs
+
+
+# Layout of the disk tier, part of its version so older files are rebuilt
+cacheFormat = 2
+
+# Default on-disk cache shared by GUI sessions
+defaultCachePath = os.path.join(os.path.expanduser("~"), ".cache", "engine-initial-variables", "solves.sqlite")
+
+
+#---------------------------------------------
+# Equation Set Version
+#---------------------------------------------
+def equationVersion():
+    """Hash of the equation set, cached results are dropped when it changes"""
+
+    equations = sorted((eqID, sorted(eqVars)) for eqID, eqVars in eqVars_dict.items())
+    constants = sorted(constantVars.items())
+
+    return hashlib.sha1(repr((cacheFormat, equations, constants)).encode()).hexdigest()
+
+
+#---------------------------------------------
+# Key Quantization
+#---------------------------------------------
+def quantize(values, precision):
+    """Rounds an array to precision significant digits, zeros and non-finite values kept"""
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exponent = np.floor(np.log10(np.abs(values)))
+        scale = 10.0 ** (precision - 1 - np.where(np.isfinite(exponent), exponent, 0))
+        rounded = np.round(values * scale) / scale
+
+    # Positive and negative zero share a key
+    return np.where(np.isfinite(rounded), rounded, values) + 0.0
+
+
+#---------------------------------------------
+# Solve Cache
+#---------------------------------------------
+class SolveCache:
+    """
+    Result cache in front of equationSolver
+
+    Cases are keyed by branch, known symbols and their values rounded to
+    precision significant digits. Results live in an in-memory LRU of
+    maxEntries cases and, when path is given, in an SQLite file holding up
+    to maxDiskEntries cases across sessions, least recently used evicted
+    first. The file is cleared whenever the equation set changes.
+
+    Misses are solved by solver, equationSolver unless another function
+    with the same inputs and results is given.
+    """
+
+    def __init__(self, maxEntries=1024, path=None, maxDiskEntries=100000, precision=10, solver=equationSolver):
+        self.solver = solver
+        self.maxEntries = maxEntries
+        self.maxDiskEntries = maxDiskEntries
+        self.precision = precision
+
+        self.memory = OrderedDict()
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.diskHits = 0
+        self.misses = 0
+
+        self.db = None
+        if path is not None:
+            self.openDisk(path)
+
+    #---------------------------------------------
+    # Solve
+    #---------------------------------------------
+    def solve(self, inputVars:dict, branch="supersonic", **kwargs):
+        """
+        Same inputs and results as equationSolver, solving only uncached cases
+
+        Array inputs are keyed and looked up in one pass, and the misses are
+        solved together in one vectorized pass. Results that are not finite
+        are returned but never cached. A mixture is resolved to gamma and M
+        before the lookup, so cases are keyed by the gas properties used.
+        """
+
+        # Raises TypeError if inputVars is not a dict
+        if not isinstance(inputVars, dict):
+            raise TypeError("inputVars must be a dict")
+
+        mixture = kwargs.pop("mixture", None)
+        if mixture is not None:
+            mixtureVars = {k: v for k, v in mixtureInputs(inputVars, mixture).items() if inputVars.get(k) is None}
+            inputVars = {**inputVars, **mixtureVars}
+
+            # Looked up gas properties are derived vars too
+            shape = np.broadcast(*(v for v in inputVars.values() if v is not None)).shape
+            mixtureVars = {k: np.broadcast_to(v, shape).copy() if shape else v for k, v in mixtureVars.items()}
+            return {**mixtureVars, **self.solve(inputVars, branch, **kwargs)}
+
+        inputVars = {k: asValue(v) for k, v in inputVars.items() if v is not None}
+        shape = np.broadcast(*inputVars.values()).shape if inputVars else ()
+
+        n = int(np.prod(shape))
+        if n == 0:
+            return self.solver(inputVars, branch=branch, **kwargs)
+
+        columns = {k: np.broadcast_to(v, shape).reshape(n) for k, v in inputVars.items()}
+        keys = self.keys(columns, branch)
+
+        symbols, values = self.lookup(keys)
+        missing = np.flatnonzero(np.isnan(values).all(axis=1)) if symbols else np.arange(n)
+
+        if missing.size:
+            # Single cases keep the scalar solve path
+            subset = inputVars if shape == () else {k: v[missing] for k, v in columns.items()}
+            solved = self.solver(subset, branch=branch, **kwargs)
+            solved = {k: np.broadcast_to(v, missing.shape) for k, v in solved.items()}
+
+            if not symbols:
+                symbols = tuple(solved)
+                values = np.full((n, len(symbols)), np.nan)
+            for j, symbol in enumerate(symbols):
+                values[missing, j] = solved[symbol]
+
+            self.store([keys[i] for i in missing], symbols, values[missing])
+
+        if shape == ():
+            return {symbol: values[0, j][()] for j, symbol in enumerate(symbols)}
+        return {symbol: values[:, j].reshape(shape).copy() for j, symbol in enumerate(symbols)}
+
+    #---------------------------------------------
+    # Keys and Lookups
+    #---------------------------------------------
+    def keys(self, columns, branch):
+        """
+        Cache keys of a set of cases, near-identical inputs share a key
+
+        Every column is rounded to precision significant digits at once, and
+        each key is a 16 byte digest of the branch, the known symbols and the
+        rounded values of one case.
+        """
+
+        names = sorted(columns)
+        header = json.dumps([branch, names]).encode() + b"\0"
+
+        rounded = np.stack([quantize(np.asarray(columns[k], dtype=float), self.precision) for k in names], axis=1)
+        rows = np.ascontiguousarray(rounded).view(np.dtype((np.void, 8 * len(names)))).ravel()
+
+        return [hashlib.blake2b(header + row, digest_size=16).digest() for row in rows.tolist()]
+
+    def lookup(self, keys):
+        """
+        Cached results of a set of cases
+
+        Returns the result symbols and an (n, symbols) array, rows of
+        missing cases all NaN. Memory misses are fetched from disk in one
+        query and marked as used in one transaction.
+        """
+
+        rows = {}
+        symbols = ()
+
+        with self.lock:
+            for i, key in enumerate(keys):
+                entry = self.memory.get(key)
+                if entry is not None:
+                    self.memory.move_to_end(key)
+                    symbols, rows[i] = entry
+
+            memoryHits = len(rows)
+            if self.db is not None and len(rows) < len(keys):
+                pending = {key: i for i, key in enumerate(keys) if i not in rows}
+
+                self.db.execute("CREATE TEMP TABLE IF NOT EXISTS lookup (key BLOB PRIMARY KEY) WITHOUT ROWID")
+                self.db.execute("DELETE FROM lookup")
+                self.db.executemany("INSERT OR IGNORE INTO lookup (key) VALUES (?)", ((key,) for key in pending))
+
+                found = self.db.execute(
+                    "SELECT cases.key, cases.symbols, cases.result FROM cases JOIN lookup ON cases.key = lookup.key"
+                ).fetchall()
+
+                if found:
+                    self.db.execute(
+                        "UPDATE cases SET used = ? WHERE key IN (SELECT key FROM lookup)",
+                        (self.nextUse(),),
+                    )
+                self.db.commit()
+
+                for n, (key, names, result) in enumerate(found):
+                    entry = (tuple(names.split(",")), np.frombuffer(result, dtype=float))
+                    symbols, rows[pending[key]] = entry
+
+                    # Only the last maxEntries would survive in memory anyway
+                    if n >= len(found) - self.maxEntries:
+                        self.remember(key, entry)
+
+            self.hits += len(rows)
+            self.diskHits += len(rows) - memoryHits
+            self.misses += len(keys) - len(rows)
+
+        values = np.full((len(keys), len(symbols)), np.nan)
+        for i, row in rows.items():
+            values[i] = row
+        return symbols, values
+
+    def store(self, keys, symbols, values):
+        """Stores the results of a set of cases in both tiers, in one disk transaction, skipping non-finite ones"""
+
+        finite = np.isfinite(values).all(axis=1)
+        cases = [(key, np.array(row)) for key, row, ok in zip(keys, values, finite) if ok]
+        if not cases:
+            return
+
+        with self.lock:
+            for key, row in cases[-self.maxEntries:]:
+                self.remember(key, (symbols, row))
+
+            if self.db is not None:
+                used = self.nextUse()
+                names = ",".join(symbols)
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO cases (key, symbols, result, used) VALUES (?, ?, ?, ?)",
+                    ((key, names, row.tobytes(), used) for key, row in cases),
+                )
+                self.evictDisk()
+                self.db.commit()
+
+    def remember(self, key, entry):
+        """Adds a case's (symbols, values) to the in-memory LRU"""
+
+        self.memory[key] = entry
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.maxEntries:
+            self.memory.popitem(last=False)
+
+    #---------------------------------------------
+    # Disk Tier
+    #---------------------------------------------
+    def openDisk(self, path):
+        """Opens the SQLite tier, clearing it if the equation set changed"""
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        # Solves run on worker threads, access is serialized by self.lock
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+        self.db.execute("CREATE TABLE IF NOT EXISTS cases (key BLOB PRIMARY KEY, symbols TEXT, result BLOB, used INTEGER) WITHOUT ROWID")
+        self.db.execute("CREATE INDEX IF NOT EXISTS cases_used ON cases (used)")
+
+        version = equationVersion()
+        row = self.db.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+        if row is None or row[0] != version:
+            self.db.execute("DROP TABLE IF EXISTS cases")
+            self.db.execute("CREATE TABLE cases (key BLOB PRIMARY KEY, symbols TEXT, result BLOB, used INTEGER) WITHOUT ROWID")
+            self.db.execute("CREATE INDEX IF NOT EXISTS cases_used ON cases (used)")
+            self.db.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('version', ?)", (version,))
+
+        self.db.commit()
+
+    def nextUse(self):
+        """Increasing use counter for LRU eviction on disk"""
+
+        row = self.db.execute("SELECT COALESCE(MAX(used), 0) FROM cases").fetchone()
+        return row[0] + 1
+
+    def evictDisk(self):
+        """Drops the least recently used cases beyond maxDiskEntries"""
+
+        count = self.db.execute("SELECT COUNT(*) FROM cases").fetchone()[0]
+        if count > self.maxDiskEntries:
+            self.db.execute(
+                "DELETE FROM cases WHERE key IN (SELECT key FROM cases ORDER BY used LIMIT ?)",
+                (count - self.maxDiskEntries,),
+            )
+
+    #---------------------------------------------
+    # Housekeeping
+    #---------------------------------------------
+    def stats(self):
+        """Hit and miss counters, disk hits are included in hits"""
+
+        with self.lock:
+            return {
+                "hits"          :   self.hits,
+                "diskHits"      :   self.diskHits,
+                "misses"        :   self.misses,
+                "memoryEntries" :   len(self.memory),
+            }
+
+    def clear(self):
+        """Empties both tiers and resets the counters"""
+
+        with self.lock:
+            self.memory.clear()
+            if self.db is not None:
+                self.db.execute("DELETE FROM cases")
+                self.db.commit()
+
+            self.hits = self.diskHits = self.misses = 0
+
+    def close(self):
+        """Closes the disk tier"""
+
+        with self.lock:
+            if self.db is not None:
+                self.db.close()
+                self.db = None
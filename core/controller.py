@@ -1,5 +1,50 @@
-from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+import logging
+import threading
+import numpy as np
 from .solver import *
+from .cache import SolveCache, defaultCachePath
+from .units import toSI, fromSI
+from .sweep import sweepSolver
+
+
+logger = logging.getLogger(__name__)
+
+
+#---------------------------------------------
+# Solve job signals
+#---------------------------------------------
+class SolveSignals(QObject):
+    finished = pyqtSignal(int, object)
+    progress = pyqtSignal(int, int, object)
+    cancelled = pyqtSignal(int)
+    failed = pyqtSignal(int, str)
+
+
+#---------------------------------------------
+# Solve job
+#---------------------------------------------
+class SolveJob(QRunnable):
+    """Runs a solver function on the thread pool and reports back via signals"""
+
+    def __init__(self, jobID, function, inputVars, **kwargs):
+        super().__init__()
+        self.jobID = jobID
+        self.function = function
+        self.inputVars = inputVars
+        self.kwargs = kwargs
+        self.signals = SolveSignals()
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            result = self.function(self.inputVars, **self.kwargs)
+        except SolveCancelled:
+            self.signals.cancelled.emit(self.jobID)
+        except Exception as e:
+            self.signals.failed.emit(self.jobID, str(e))
+        else:
+            self.signals.finished.emit(self.jobID, result)
 
 
 #---------------------------------------------
@@ -11,27 +56,80 @@ class Controller(QObject):
         super().__init__()
         self.ui = ui
 
+        # Background solves, latest (jobID, cancelEvent) per kind of job
+        self.threadPool = QThreadPool.globalInstance()
+        self.jobs = {}
+        self.jobCount = 0
+
+        # jobID of the run plotted as a sweep, labelled when it ends
+        self.sweepJobID = None
+
+        # Results of earlier solves, kept across sessions
+        self.cache = SolveCache(path=defaultCachePath)
+
+        # Cases per sweep chunk, the plot updates after each
+        self.sweepChunkSize = 65536
+
+        # Derived vars, updated incrementally per toggle
+        self.propagator = ConstraintPropagator()
+
         # Connect UI signals
         self.ui.inputSection.checkboxToggled.connect(self.checkboxToggled)
         self.ui.globalButtons.runButtonClicked.connect(self.runClicked)
+        self.ui.globalButtons.cancelButtonClicked.connect(self.cancelClicked)
 
     #---------------------------------------------
     # Handlers for UI signals
     #---------------------------------------------
     def checkboxToggled(self):
         """Called whenever a checkbox is toggled"""
-        selectedData = self.ui.inputSection.getCheckedData()
-        inputVars = {}
+        # Changed inputs make a running solve stale
+        self.cancelJob("run")
 
-        # Extract symbol:value pairs
-        for name, entry in selectedData.items():
-            symbol = entry["symbol"]
-            value = entry["value"]
-            inputVars[symbol] = value
+        # Incremental, cheap enough to stay on the event loop
+        derivedVars = self.propagator.update(self.inputVars())
+
+        self.showDerived(derivedVars)
+
+
+    def runClicked(self):
+        """Called whenever the run button is clicked"""
+        # The previous run is labelled cancelled before the plot is cleared for a new sweep
+        self.cancelJob("run")
 
-        # Run constraint checker
-        derivedVars = constraintChecker(inputVars)
+        cancelEvent = threading.Event()
+        inputVars = self.inputVars()
 
+        # Range inputs are swept chunk by chunk and plotted as they come in
+        sweptVars = {k: v for k, v in inputVars.items() if isinstance(v, np.ndarray) and v.ndim > 0}
+        if sweptVars:
+            units = self.ui.inputSection.getUnits()
+            self.ui.sweepPlot.startSweep(
+                next(iter(sweptVars)),
+                {k: fromSI(v, units.get(k), k) for k, v in sweptVars.items()},
+                units,
+            )
+            self.submitJob(
+                "run", sweepSolver, inputVars, self.runFinished,
+                progressHandler=self.sweepProgress, cancelEvent=cancelEvent, chunkSize=self.sweepChunkSize,
+            )
+            self.sweepJobID = self.jobCount
+        else:
+            self.submitJob("run", self.cache.solve, inputVars, self.runFinished, cancelEvent=cancelEvent)
+
+        self.ui.globalButtons.setRunning(True)
+
+
+    def cancelClicked(self):
+        """Called whenever the cancel button is clicked"""
+        self.cancelJob("run")
+
+
+    #---------------------------------------------
+    # Handlers for constraint and solve results
+    #---------------------------------------------
+    def showDerived(self, derivedVars):
+        """Greys out the derived fields"""
         # Enable all inputs
         self.ui.inputSection.enableAllFields()
 
@@ -39,27 +137,120 @@ class Controller(QObject):
         if derivedVars:
             self.ui.inputSection.disableField(derivedVars)
 
-        # Debug print
-        print(f"[Controller] Derived: {list(derivedVars.keys()) if derivedVars else 'none'}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Derived: %s", list(derivedVars.keys()) if derivedVars else "none")
 
 
-    def runClicked(self):
-        """Called whenever a checkbox is toggled"""
+    def runFinished(self, jobID, derivedVars):
+        """Called when a solve finishes"""
+        if not self.finishJob("run", jobID):
+            return
+
+        self.ui.inputSection.enableAllFields()
+
+        if jobID == self.sweepJobID:
+            self.sweepJobID = None
+            self.ui.sweepPlot.finishSweep()
+
+        if isinstance(derivedVars, dict) and derivedVars:
+            # Results are shown in each field's selected unit
+            units = self.ui.inputSection.getUnits()
+            derivedVars = {k: fromSI(v, units.get(k), k) for k, v in derivedVars.items()}
+
+            self.ui.inputSection.disableField(derivedVars)
+        else:
+            logger.info("No derived variables found")
+
+
+    def sweepProgress(self, jobID, start, derivedVars):
+        """Called after each chunk of a sweep"""
+        if self.jobs.get("run", (None, None))[0] != jobID:
+            return
+
+        units = self.ui.inputSection.getUnits()
+        self.ui.sweepPlot.addChunk(start, {k: fromSI(v, units.get(k), k) for k, v in derivedVars.items()})
+
+
+    def jobStopped(self, jobID, message=None):
+        """Called when a job is cancelled or fails"""
+        for kind, (currentID, _) in list(self.jobs.items()):
+            if currentID == jobID:
+                self.finishJob(kind, jobID)
+                if jobID == self.sweepJobID:
+                    self.sweepJobID = None
+                    self.ui.sweepPlot.finishSweep(cancelled=True)
+
+        if message is not None:
+            logger.error("Solve failed: %s", message)
+
+
+    #---------------------------------------------
+    # Job management
+    #---------------------------------------------
+    def inputVars(self):
+        """Extract symbol:value pairs in SI from the checked inputs"""
         selectedData = self.ui.inputSection.getCheckedData()
         inputVars = {}
 
-        # Extract symbol:value pairs
         for name, entry in selectedData.items():
             symbol = entry["symbol"]
             value = entry["value"]
-
+            if value is not None:
+                value = toSI(value, entry["unit"], symbol)
             inputVars[symbol] = value
 
-        derivedVars = equationSolver(inputVars)
+        return inputVars
 
-        self.ui.inputSection.enableAllFields()
 
-        if isinstance(derivedVars, dict) and derivedVars:
-            self.ui.inputSection.disableField(derivedVars)
-        else:
-            print("[Controller] No derived variables found.")
\ No newline at end of file
+    def submitJob(self, kind, function, inputVars, handler, progressHandler=None, **kwargs):
+        """
+        Runs function on the thread pool, superseding any job of the same kind
+
+        With a progressHandler, function is passed a progress(start, results)
+        callback whose calls reach progressHandler on the event loop.
+        """
+        self.cancelJob(kind)
+
+        self.jobCount += 1
+        job = SolveJob(self.jobCount, function, inputVars, **kwargs)
+        job.signals.finished.connect(handler)
+        if progressHandler is not None:
+            job.signals.progress.connect(progressHandler)
+            job.kwargs["progress"] = lambda start, results, jobID=job.jobID, signals=job.signals: signals.progress.emit(jobID, start, results)
+        job.signals.cancelled.connect(self.jobStopped)
+        job.signals.failed.connect(self.jobStopped)
+
+        self.jobs[kind] = (self.jobCount, kwargs.get("cancelEvent"))
+        self.threadPool.start(job)
+
+
+    def cancelJob(self, kind):
+        """
+        Cancels and forgets the current job of a kind, its results are dropped
+
+        A cancelled sweep is labelled here, its cancelled signal arrives
+        after the job is forgotten and is ignored as stale.
+        """
+        jobID, cancelEvent = self.jobs.pop(kind, (None, None))
+        if cancelEvent is not None:
+            cancelEvent.set()
+
+        if jobID is not None and jobID == self.sweepJobID:
+            self.sweepJobID = None
+            self.ui.sweepPlot.finishSweep(cancelled=True)
+
+        if kind == "run":
+            self.ui.globalButtons.setRunning(False)
+
+
+    def finishJob(self, kind, jobID):
+        """Returns False for stale jobs, otherwise marks the job of a kind done"""
+        if self.jobs.get(kind, (None, None))[0] != jobID:
+            return False
+
+        del self.jobs[kind]
+
+        if kind == "run":
+            self.ui.globalButtons.setRunning(False)
+
+        return True
@@ -0,0 +1,181 @@
+import os
+import logging
+from functools import lru_cache
+
+import numpy
+
+from .physics import R_universal
+
+
+logger = logging.getLogger(__name__)
+
+# Directory holding the property tables
+dataDirectory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Mixture : table file in dataDirectory, columns T, gamma, M in SI, others such as cp are ignored
+mixture_dict = {
+    "air"       :   "air.csv",          # Air, 250-1000 K
+    "hydrolox"  :   "hydrolox.csv",     # LOX/LH2 products at O/F = 6, frozen, 300-3500 K
+}
+
+# Table columns
+properties = ("T", "gamma", "M")
+
+
+#---------------------------------------------
+# Table Loading
+#---------------------------------------------
+@lru_cache(maxsize=None)
+def loadTable(mixture):
+    """
+    Loads a mixture's property table as (T, gamma, M) column arrays
+
+    A .npy file next to the CSV with the same name takes precedence and is
+    memory-mapped, so large tables are paged in on demand instead of parsed.
+    Rows must be sorted by temperature.
+    """
+    if mixture not in mixture_dict:
+        raise ValueError(f"Unknown mixture {mixture!r}, expected one of {sorted(mixture_dict)}")
+
+    path = os.path.join(dataDirectory, mixture_dict[mixture])
+    binaryPath = os.path.splitext(path)[0] + ".npy"
+
+    if os.path.exists(binaryPath):
+        table = numpy.load(binaryPath, mmap_mode="r")
+    else:
+        table = readCSV(path)
+
+    if table.shape[0] != len(properties):
+        raise ValueError(f"{mixture!r} table must have the columns {properties}")
+
+    return tuple(table)
+
+
+def readCSV(path):
+    """Reads a CSV table with '#' comments and a header row, columns reordered as properties"""
+    with open(path) as f:
+        lines = [line for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+    header = [name.strip() for name in lines[0].split(",")]
+
+    # Raises ValueError if a property column is missing
+    missing = set(properties) - set(header)
+    if missing:
+        raise ValueError(f"{path} is missing the columns {sorted(missing)}")
+
+    data = numpy.loadtxt(lines[1:], delimiter=",", ndmin=2).T
+    return numpy.stack([data[header.index(name)] for name in properties])
+
+
+def saveBinary(mixture):
+    """Writes a mixture's CSV table as a .npy file for memory-mapped loading"""
+    path = os.path.join(dataDirectory, mixture_dict[mixture])
+    table = readCSV(path)
+
+    numpy.save(os.path.splitext(path)[0] + ".npy", table)
+    loadTable.cache_clear()
+    interpolator.cache_clear()
+
+
+def registerMixture(mixture, fileName):
+    """Adds a table file in dataDirectory as a mixture, e.g. CEA output converted to T, gamma, M"""
+    mixture_dict[mixture] = fileName
+    loadTable.cache_clear()
+    interpolator.cache_clear()
+
+
+#---------------------------------------------
+# Interpolation
+#---------------------------------------------
+@lru_cache(maxsize=None)
+def interpolator(mixture, prop):
+    """
+    Cached vectorized interpolator of one property over temperature
+
+    The table columns are looked up once per mixture and property, and the
+    returned function linearly interpolates scalars or whole arrays of
+    temperatures. Temperatures outside the table give NaN.
+    """
+    table = dict(zip(properties, loadTable(mixture)))
+    if prop not in table or prop == "T":
+        raise ValueError(f"Unknown property {prop!r}, expected one of {properties[1:]}")
+
+    T = numpy.ascontiguousarray(table["T"], dtype=float)
+    values = numpy.ascontiguousarray(table[prop], dtype=float)
+
+    def interpolate(temperature):
+        return numpy.interp(temperature, T, values, left=numpy.nan, right=numpy.nan)
+
+    return interpolate
+
+
+def tableRange(mixture):
+    """Lowest and highest temperature of a mixture's table"""
+    T = loadTable(mixture)[0]
+    return float(T[0]), float(T[-1])
+
+
+#---------------------------------------------
+# Gas Properties
+#---------------------------------------------
+def gasProperties(mixture, T):
+    """
+    Properties of a mixture at temperature T
+
+    Returns gamma, M and the specific gas constant R = R' / M, each a
+    scalar or an array matching T. Raises ValueError when a single
+    temperature lies outside the table. Temperatures of an array outside
+    it get NaN, with a warning logged.
+    """
+    low, high = tableRange(mixture)
+    outside = ~((numpy.asarray(T) >= low) & (numpy.asarray(T) <= high))
+
+    # Raises ValueError if a single case cannot be looked up
+    if outside.ndim == 0 and outside:
+        raise ValueError(f"{mixture!r} table covers {low:g}-{high:g} K, T = {float(T):g} K is outside it")
+    if outside.any():
+        logger.warning("%d of %d cases lie outside the %r table (%g-%g K) and get NaN", outside.sum(), outside.size, mixture, low, high)
+
+    M = interpolator(mixture, "M")(T)
+
+    return {
+        "gamma"     :   interpolator(mixture, "gamma")(T),
+        "M"         :   M,
+        "R"         :   R_universal / M,
+    }
+
+
+#---------------------------------------------
+# Mixture Inputs
+#---------------------------------------------
+def mixtureInputs(inputVars:dict, mixture):
+    """
+    Fills gamma and M from a mixture table at the stagnation temperature
+
+    The flow is treated as frozen, so gamma and M are evaluated once at T_c
+    or T_s, whichever is given, and do not vary through the nozzle. Values
+    already in inputVars are kept, and M is left out when R is given.
+
+    Temperatures outside the table are handled as in gasProperties.
+    """
+    # Nothing to look up
+    if inputVars.get("gamma") is not None and (inputVars.get("M") is not None or inputVars.get("R") is not None):
+        return dict(inputVars)
+
+    T = inputVars.get("T_c")
+    if T is None:
+        T = inputVars.get("T_s")
+
+    # Raises ValueError without a stagnation temperature to evaluate at
+    if T is None:
+        raise ValueError("A mixture needs T_c or T_s as an input")
+
+    props = gasProperties(mixture, T)
+    inputVars = dict(inputVars)
+
+    if inputVars.get("gamma") is None:
+        inputVars["gamma"] = props["gamma"]
+    if inputVars.get("M") is None and inputVars.get("R") is None:
+        inputVars["M"] = props["M"]
+
+    return inputVars
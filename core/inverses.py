@@ -0,0 +1,241 @@
+import numpy
+
+from .physics import R_universal
+
+
+#---------------------------------------------
+# Specific Gas Constant
+#---------------------------------------------
+def specificGasConstant_M(R):
+    """M = R' / R"""
+    return R_universal / R
+
+def specificGasConstant_R(M):
+    """R = R' / M"""
+    return R_universal / M
+
+
+#---------------------------------------------
+# Isentropic Temperature Ratio
+#---------------------------------------------
+def temperatureRatio_Ma(T, T_s, gamma):
+    """Ma = sqrt(2 / (gamma - 1) * (T_s / T - 1))"""
+    return numpy.sqrt(2 / (gamma - 1) * (T_s / T - 1))
+
+def temperatureRatio_T(Ma, T_s, gamma):
+    """T = T_s / [1 + 1/2 * (gamma - 1) * Ma ^ 2]"""
+    return T_s / (1 + 0.5 * (gamma - 1) * Ma ** 2)
+
+def temperatureRatio_T_s(Ma, T, gamma):
+    """T_s = T * [1 + 1/2 * (gamma - 1) * Ma ^ 2]"""
+    return T * (1 + 0.5 * (gamma - 1) * Ma ** 2)
+
+def temperatureRatio_gamma(Ma, T, T_s):
+    """gamma = 1 + 2 * (T_s / T - 1) / Ma ^ 2"""
+    return 1 + 2 * (T_s / T - 1) / Ma ** 2
+
+
+#---------------------------------------------
+# Isentropic Pressure Ratio
+#---------------------------------------------
+def pressureRatio_Ma(P, P_s, gamma):
+    """Ma = sqrt(2 / (gamma - 1) * ((P_s / P) ^ ((gamma - 1) / gamma) - 1))"""
+    return numpy.sqrt(2 / (gamma - 1) * ((P_s / P) ** ((gamma - 1) / gamma) - 1))
+
+def pressureRatio_P(Ma, P_s, gamma):
+    """P = P_s * [1 + 1/2 * (gamma - 1) * Ma ^ 2] ^ (-gamma / (gamma - 1))"""
+    return P_s * (1 + 0.5 * (gamma - 1) * Ma ** 2) ** (-gamma / (gamma - 1))
+
+def pressureRatio_P_s(Ma, P, gamma):
+    """P_s = P * [1 + 1/2 * (gamma - 1) * Ma ^ 2] ^ (gamma / (gamma - 1))"""
+    return P * (1 + 0.5 * (gamma - 1) * Ma ** 2) ** (gamma / (gamma - 1))
+
+
+#---------------------------------------------
+# Area-Mach Relation
+#---------------------------------------------
+def _areaRatio(Ma_t, Ma_e, gamma):
+    """A_e / A_t for the given Mach numbers"""
+    return Ma_t / Ma_e * numpy.sqrt(((1 + (gamma - 1) / 2 * Ma_e ** 2) / (1 + (gamma - 1) / 2 * Ma_t ** 2)) ** ((gamma + 1) / (gamma - 1)))
+
+def areaMachRelation_A_t(A_e, Ma_t, Ma_e, gamma):
+    """A_t = A_e / (A_e / A_t)"""
+    return A_e / _areaRatio(Ma_t, Ma_e, gamma)
+
+def areaMachRelation_A_e(A_t, Ma_t, Ma_e, gamma):
+    """A_e = A_t * (A_e / A_t)"""
+    return A_t * _areaRatio(Ma_t, Ma_e, gamma)
+
+
+#---------------------------------------------
+# Isentropic Exit Velocity
+#---------------------------------------------
+def _kineticTerm(v_e, gamma):
+    """R * T_s * (1 - (P_e / P_s) ^ ((gamma - 1) / gamma)) = v_e ^ 2 * (gamma - 1) / (2 * gamma)"""
+    return v_e ** 2 * (gamma - 1) / (2 * gamma)
+
+def exitVelocity_P_e(P_s, T_s, v_e, R, gamma):
+    """P_e = P_s * (1 - k / (R * T_s)) ^ (gamma / (gamma - 1))"""
+    return P_s * (1 - _kineticTerm(v_e, gamma) / (R * T_s)) ** (gamma / (gamma - 1))
+
+def exitVelocity_P_s(P_e, T_s, v_e, R, gamma):
+    """P_s = P_e / (1 - k / (R * T_s)) ^ (gamma / (gamma - 1))"""
+    return P_e / (1 - _kineticTerm(v_e, gamma) / (R * T_s)) ** (gamma / (gamma - 1))
+
+def exitVelocity_T_s(P_e, P_s, v_e, R, gamma):
+    """T_s = k / (R * (1 - (P_e / P_s) ^ ((gamma - 1) / gamma)))"""
+    return _kineticTerm(v_e, gamma) / (R * (1 - (P_e / P_s) ** ((gamma - 1) / gamma)))
+
+def exitVelocity_v_e(P_e, P_s, T_s, R, gamma):
+    """v_e = sqrt((2 * gamma) / (gamma - 1) * R * T_s * (1 - (P_e / P_s) ^ ((gamma - 1) / gamma)))"""
+    return numpy.sqrt((2 * gamma) / (gamma - 1) * R * T_s * (1 - (P_e / P_s) ** ((gamma - 1) / gamma)))
+
+def exitVelocity_R(P_e, P_s, T_s, v_e, gamma):
+    """R = k / (T_s * (1 - (P_e / P_s) ^ ((gamma - 1) / gamma)))"""
+    return _kineticTerm(v_e, gamma) / (T_s * (1 - (P_e / P_s) ** ((gamma - 1) / gamma)))
+
+
+#---------------------------------------------
+# Choked Mass Flow
+#---------------------------------------------
+def _chokedFactor(gamma):
+    """(2 / (gamma + 1)) ^ ((gamma + 1) / (2 * (gamma - 1)))"""
+    return (2 / (gamma + 1)) ** ((gamma + 1) / (2 * (gamma - 1)))
+
+def massFlow_A_t(mdot, P_s, T_s, R, gamma):
+    """A_t = mdot / (P_s * sqrt(gamma / (R * T_s)) * G)"""
+    return mdot / (P_s * numpy.sqrt(gamma / (R * T_s)) * _chokedFactor(gamma))
+
+def massFlow_mdot(A_t, P_s, T_s, R, gamma):
+    """mdot = A_t * P_s * sqrt(gamma / (R * T_s)) * G"""
+    return A_t * P_s * numpy.sqrt(gamma / (R * T_s)) * _chokedFactor(gamma)
+
+def massFlow_P_s(A_t, mdot, T_s, R, gamma):
+    """P_s = mdot / (A_t * sqrt(gamma / (R * T_s)) * G)"""
+    return mdot / (A_t * numpy.sqrt(gamma / (R * T_s)) * _chokedFactor(gamma))
+
+def massFlow_T_s(A_t, mdot, P_s, R, gamma):
+    """T_s = gamma / R * (A_t * P_s * G / mdot) ^ 2"""
+    return gamma / R * (A_t * P_s * _chokedFactor(gamma) / mdot) ** 2
+
+def massFlow_R(A_t, mdot, P_s, T_s, gamma):
+    """R = gamma / T_s * (A_t * P_s * G / mdot) ^ 2"""
+    return gamma / T_s * (A_t * P_s * _chokedFactor(gamma) / mdot) ** 2
+
+
+#---------------------------------------------
+# Thrust
+#---------------------------------------------
+def thrust_A_e(F, mdot, P_a, P_e, v_e):
+    """A_e = (F - mdot * v_e) / (P_e - P_a)"""
+    return (F - mdot * v_e) / (P_e - P_a)
+
+def thrust_F(A_e, mdot, P_a, P_e, v_e):
+    """F = mdot * v_e + (P_e - P_a) * A_e"""
+    return mdot * v_e + (P_e - P_a) * A_e
+
+def thrust_mdot(A_e, F, P_a, P_e, v_e):
+    """mdot = (F - (P_e - P_a) * A_e) / v_e"""
+    return (F - (P_e - P_a) * A_e) / v_e
+
+def thrust_P_a(A_e, F, mdot, P_e, v_e):
+    """P_a = P_e - (F - mdot * v_e) / A_e"""
+    return P_e - (F - mdot * v_e) / A_e
+
+def thrust_P_e(A_e, F, mdot, P_a, v_e):
+    """P_e = P_a + (F - mdot * v_e) / A_e"""
+    return P_a + (F - mdot * v_e) / A_e
+
+def thrust_v_e(A_e, F, mdot, P_a, P_e):
+    """v_e = (F - (P_e - P_a) * A_e) / mdot"""
+    return (F - (P_e - P_a) * A_e) / mdot
+
+
+#---------------------------------------------
+# Temperature / Pressure Equivalence
+#---------------------------------------------
+def temperatureEquivalence_T_c(T_s):
+    """T_c = T_s"""
+    return T_s
+
+def temperatureEquivalence_T_s(T_c):
+    """T_s = T_c"""
+    return T_c
+
+def pressureEquivalence_P_c(P_s):
+    """P_c = P_s"""
+    return P_s
+
+def pressureEquivalence_P_s(P_c):
+    """P_s = P_c"""
+    return P_c
+
+
+#---------------------------------------------
+# Isentropic Flow Relation
+#---------------------------------------------
+def flowRelation_P(P_s, T, T_s, gamma):
+    """P = P_s * (T / T_s) ^ (gamma / (gamma - 1))"""
+    return P_s * (T / T_s) ** (gamma / (gamma - 1))
+
+def flowRelation_P_s(P, T, T_s, gamma):
+    """P_s = P / (T / T_s) ^ (gamma / (gamma - 1))"""
+    return P / (T / T_s) ** (gamma / (gamma - 1))
+
+def flowRelation_T(P, P_s, T_s, gamma):
+    """T = T_s * (P / P_s) ^ ((gamma - 1) / gamma)"""
+    return T_s * (P / P_s) ** ((gamma - 1) / gamma)
+
+def flowRelation_T_s(P, P_s, T, gamma):
+    """T_s = T / (P / P_s) ^ ((gamma - 1) / gamma)"""
+    return T / (P / P_s) ** ((gamma - 1) / gamma)
+
+def flowRelation_gamma(P, P_s, T, T_s):
+    """gamma = k / (k - 1), k = ln(P / P_s) / ln(T / T_s)"""
+    k = numpy.log(P / P_s) / numpy.log(T / T_s)
+    return k / (k - 1)
+
+
+#---------------------------------------------
+# Inverse Registry
+#---------------------------------------------
+# (function name, unknown arg) : explicit solver taking the remaining args
+# Pairs missing here are implicit and fall back to numerical root-finding
+inverse_dict = {
+    ("specificGasConstant",     "M")        :   specificGasConstant_M,
+    ("specificGasConstant",     "R")        :   specificGasConstant_R,
+    ("temperatureRatio",        "Ma")       :   temperatureRatio_Ma,
+    ("temperatureRatio",        "T")        :   temperatureRatio_T,
+    ("temperatureRatio",        "T_s")      :   temperatureRatio_T_s,
+    ("temperatureRatio",        "gamma")    :   temperatureRatio_gamma,
+    ("pressureRatio",           "Ma")       :   pressureRatio_Ma,
+    ("pressureRatio",           "P")        :   pressureRatio_P,
+    ("pressureRatio",           "P_s")      :   pressureRatio_P_s,
+    ("areaMachRelation",        "A_t")      :   areaMachRelation_A_t,
+    ("areaMachRelation",        "A_e")      :   areaMachRelation_A_e,
+    ("exitVelocity",            "P_e")      :   exitVelocity_P_e,
+    ("exitVelocity",            "P_s")      :   exitVelocity_P_s,
+    ("exitVelocity",            "T_s")      :   exitVelocity_T_s,
+    ("exitVelocity",            "v_e")      :   exitVelocity_v_e,
+    ("exitVelocity",            "R")        :   exitVelocity_R,
+    ("massFlow",                "A_t")      :   massFlow_A_t,
+    ("massFlow",                "mdot")     :   massFlow_mdot,
+    ("massFlow",                "P_s")      :   massFlow_P_s,
+    ("massFlow",                "T_s")      :   massFlow_T_s,
+    ("massFlow",                "R")        :   massFlow_R,
+    ("thrust",                  "A_e")      :   thrust_A_e,
+    ("thrust",                  "F")        :   thrust_F,
+    ("thrust",                  "mdot")     :   thrust_mdot,
+    ("thrust",                  "P_a")      :   thrust_P_a,
+    ("thrust",                  "P_e")      :   thrust_P_e,
+    ("thrust",                  "v_e")      :   thrust_v_e,
+    ("temperatureEquivalence",  "T_c")      :   temperatureEquivalence_T_c,
+    ("temperatureEquivalence",  "T_s")      :   temperatureEquivalence_T_s,
+    ("pressureEquivalence",     "P_c")      :   pressureEquivalence_P_c,
+    ("pressureEquivalence",     "P_s")      :   pressureEquivalence_P_s,
+    ("flowRelation",            "P")        :   flowRelation_P,
+    ("flowRelation",            "P_s")      :   flowRelation_P_s,
+    ("flowRelation",            "T")        :   flowRelation_T,
+    ("flowRelation",            "T_s")      :   flowRelation_T_s,
+    ("flowRelation",            "gamma")    :   flowRelation_gamma,
+}
@@ -0,0 +1,202 @@
+import numpy
+
+from .physics import R_universal
+
+
+#---------------------------------------------
+# Specific Gas Constant
+#---------------------------------------------
+def specificGasConstant_grad(M, R):
+    """
+    Partials of 0 = R' / M - R
+    """
+    return {
+        "M"     :   -R_universal / M ** 2,
+        "R"     :   -1.0,
+    }
+
+
+#---------------------------------------------
+# Isentropic Temperature Ratio
+#---------------------------------------------
+def temperatureRatio_grad(Ma, T, T_s, gamma):
+    """
+    Partials of 0 = T / T_s - X ^ -1
+    X = 1 + 1/2 * (gamma - 1) * Ma ^ 2
+    """
+    X = 1 + 0.5 * (gamma - 1) * Ma ** 2
+
+    return {
+        "Ma"    :   (gamma - 1) * Ma / X ** 2,
+        "T"     :   1 / T_s,
+        "T_s"   :   -T / T_s ** 2,
+        "gamma" :   0.5 * Ma ** 2 / X ** 2,
+    }
+
+
+#---------------------------------------------
+# Isentropic Pressure Ratio
+#---------------------------------------------
+def pressureRatio_grad(Ma, P, P_s, gamma):
+    """
+    Partials of 0 = P / P_s - X ^ e
+    X = 1 + 1/2 * (gamma - 1) * Ma ^ 2
+    e = -gamma / (gamma - 1)
+    """
+    X = 1 + 0.5 * (gamma - 1) * Ma ** 2
+    e = -gamma / (gamma - 1)
+    Y = X ** e
+
+    return {
+        "Ma"    :   gamma * Ma * Y / X,
+        "P"     :   1 / P_s,
+        "P_s"   :   -P / P_s ** 2,
+        "gamma" :   -Y * (numpy.log(X) / (gamma - 1) ** 2 + e * 0.5 * Ma ** 2 / X),
+    }
+
+
+#---------------------------------------------
+# Area-Mach Relation
+#---------------------------------------------
+def areaMachRelation_grad(A_t, A_e, Ma_t, Ma_e, gamma):
+    """
+    Partials of 0 = A_e / A_t - Q
+    Q = Ma_t / Ma_e * (X_e / X_t) ^ (n / 2)
+    n = (gamma + 1) / (gamma - 1)
+    """
+    X_t = 1 + (gamma - 1) / 2 * Ma_t ** 2
+    X_e = 1 + (gamma - 1) / 2 * Ma_e ** 2
+    n = (gamma + 1) / (gamma - 1)
+    Q = Ma_t / Ma_e * (X_e / X_t) ** (n / 2)
+
+    return {
+        "A_t"   :   -A_e / A_t ** 2,
+        "A_e"   :   1 / A_t,
+        "Ma_t"  :   -Q * (1 / Ma_t - (gamma + 1) / 2 * Ma_t / X_t),
+        "Ma_e"  :   -Q * (-1 / Ma_e + (gamma + 1) / 2 * Ma_e / X_e),
+        "gamma" :   -Q * (-numpy.log(X_e / X_t) / (gamma - 1) ** 2 + n / 4 * (Ma_e ** 2 / X_e - Ma_t ** 2 / X_t)),
+    }
+
+
+#---------------------------------------------
+# Isentropic Exit Velocity
+#---------------------------------------------
+def exitVelocity_grad(P_e, P_s, T_s, v_e, R, gamma):
+    """
+    Partials of 0 = v_e - sqrt(W)
+    W = K * (1 - (P_e / P_s) ^ c)
+    K = (2 * gamma) / (gamma - 1) * R * T_s
+    c = (gamma - 1) / gamma
+    """
+    c = (gamma - 1) / gamma
+    K = (2 * gamma) / (gamma - 1) * R * T_s
+    Y = (P_e / P_s) ** c
+    W = K * (1 - Y)
+    scale = -0.5 / numpy.sqrt(W)
+
+    return {
+        "P_e"   :   scale * -K * c * Y / P_e,
+        "P_s"   :   scale * K * c * Y / P_s,
+        "T_s"   :   scale * W / T_s,
+        "v_e"   :   1.0,
+        "R"     :   scale * W / R,
+        "gamma" :   scale * (-2 * R * T_s / (gamma - 1) ** 2 * (1 - Y) - K * Y * numpy.log(P_e / P_s) / gamma ** 2),
+    }
+
+
+#---------------------------------------------
+# Choked Mass Flow
+#---------------------------------------------
+def massFlow_grad(A_t, mdot, P_s, T_s, R, gamma):
+    """
+    Partials of 0 = mdot - m
+    m = A_t * P_s * sqrt(gamma / (R * T_s)) * (2 / (gamma + 1)) ^ ((gamma + 1) / (2 * (gamma - 1)))
+    """
+    m = A_t * P_s * numpy.sqrt(gamma / (R * T_s)) * (2 / (gamma + 1)) ** ((gamma + 1) / (2 * (gamma - 1)))
+    dlnG = -numpy.log(2 / (gamma + 1)) / (gamma - 1) ** 2 - 1 / (2 * (gamma - 1))
+
+    return {
+        "A_t"   :   -m / A_t,
+        "mdot"  :   1.0,
+        "P_s"   :   -m / P_s,
+        "T_s"   :   m / (2 * T_s),
+        "R"     :   m / (2 * R),
+        "gamma" :   -m * (1 / (2 * gamma) + dlnG),
+    }
+
+
+#---------------------------------------------
+# Thrust
+#---------------------------------------------
+def thrust_grad(A_e, F, mdot, P_a, P_e, v_e):
+    """
+    Partials of 0 = F - (mdot * v_e + (P_e - P_a) * A_e)
+    """
+    return {
+        "A_e"   :   -(P_e - P_a),
+        "F"     :   1.0,
+        "mdot"  :   -v_e,
+        "P_a"   :   A_e,
+        "P_e"   :   -A_e,
+        "v_e"   :   -mdot,
+    }
+
+
+#---------------------------------------------
+# Temperature / Pressure Equivalence
+#---------------------------------------------
+def temperatureEquivalence_grad(T_c, T_s):
+    """
+    Partials of 0 = T_c - T_s
+    """
+    return {
+        "T_c"   :   1.0,
+        "T_s"   :   -1.0,
+    }
+
+def pressureEquivalence_grad(P_c, P_s):
+    """
+    Partials of 0 = P_c - P_s
+    """
+    return {
+        "P_c"   :   1.0,
+        "P_s"   :   -1.0,
+    }
+
+
+#---------------------------------------------
+# Isentropic Flow Relation
+#---------------------------------------------
+def flowRelation_grad(P, P_s, T, T_s, gamma):
+    """
+    Partials of 0 = P / P_s - (T / T_s) ^ m
+    m = gamma / (gamma - 1)
+    """
+    m = gamma / (gamma - 1)
+    Y = (T / T_s) ** m
+
+    return {
+        "P"     :   1 / P_s,
+        "P_s"   :   -P / P_s ** 2,
+        "T"     :   -m * Y / T,
+        "T_s"   :   m * Y / T_s,
+        "gamma" :   Y * numpy.log(T / T_s) / (gamma - 1) ** 2,
+    }
+
+
+#---------------------------------------------
+# Jacobian Registry
+#---------------------------------------------
+# function name : partials of the residual with respect to each arg
+jacobian_dict = {
+    "specificGasConstant"       :   specificGasConstant_grad,
+    "temperatureRatio"          :   temperatureRatio_grad,
+    "pressureRatio"             :   pressureRatio_grad,
+    "areaMachRelation"          :   areaMachRelation_grad,
+    "exitVelocity"              :   exitVelocity_grad,
+    "massFlow"                  :   massFlow_grad,
+    "thrust"                    :   thrust_grad,
+    "temperatureEquivalence"    :   temperatureEquivalence_grad,
+    "pressureEquivalence"       :   pressureEquivalence_grad,
+    "flowRelation"              :   flowRelation_grad,
+}
@@ -0,0 +1,67 @@
+import numpy
+
+from .roots import areaMachRoot, branches
+from .inverses import temperatureRatio_T, pressureRatio_P
+from .gases import gasProperties
+
+
+#---------------------------------------------
+# Nozzle Profile
+#---------------------------------------------
+def nozzleProfile(area, P_s, T_s, gamma=None, R=None, branch="supersonic", mixture=None):
+    """
+    Quasi-1D isentropic flow at every station of a nozzle contour
+
+    area holds the cross-section at each station in flow order. The nozzle is
+    taken as choked at its smallest station, so A* is the minimum area, the
+    stations upstream of it are on the subsonic Area-Mach branch and the
+    stations downstream on branch. All stations are solved in one vectorized
+    pass, with T and P from the isentropic temperature and pressure ratios.
+
+    gamma and R may be left out when a mixture is given, they are then
+    frozen at T_s. Returns areaRatio, Ma, T and P per station, plus the
+    velocity v and density rho when R is known.
+    """
+
+    # Raises ValueError for an unknown branch
+    if branch not in branches:
+        raise ValueError(f"branch must be one of {branches}")
+
+    area = numpy.asarray(area, dtype=float)
+
+    # Raises ValueError if the contour is not a 1-D array of stations
+    if area.ndim != 1 or area.size == 0:
+        raise ValueError("area must be a non-empty 1-D array of stations")
+
+    # Raises ValueError if T_s lies outside the mixture table
+    if mixture is not None and (gamma is None or R is None):
+        props = gasProperties(mixture, T_s)
+        gamma = props["gamma"] if gamma is None else gamma
+        R = props["R"] if R is None else R
+
+    # Raises ValueError without a ratio of specific heats
+    if gamma is None:
+        raise ValueError("gamma must be given, or a mixture to look it up from")
+
+    throat = int(numpy.argmin(area))
+    areaRatio = area / area[throat]
+
+    # Only the branch each station is on is solved
+    gamma = numpy.broadcast_to(numpy.asarray(gamma, dtype=float), area.shape)
+    Ma = numpy.empty(area.size)
+    Ma[:throat] = areaMachRoot(areaRatio[:throat], gamma[:throat], "subsonic")
+    Ma[throat + 1:] = areaMachRoot(areaRatio[throat + 1:], gamma[throat + 1:], branch)
+    Ma[throat] = 1.0
+
+    profile = {
+        "areaRatio" :   areaRatio,
+        "Ma"        :   Ma,
+        "T"         :   temperatureRatio_T(Ma, T_s, gamma),
+        "P"         :   pressureRatio_P(Ma, P_s, gamma),
+    }
+
+    if R is not None:
+        profile["v"] = Ma * numpy.sqrt(gamma * R * profile["T"])
+        profile["rho"] = profile["P"] / (R * profile["T"])
+
+    return profile
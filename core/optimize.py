@@ -0,0 +1,152 @@
+import logging
+
+import numpy as np
+
+from .solver import equationSolver, asValue
+from .atmosphere import g_0
+
+
+logger = logging.getLogger(__name__)
+
+# Objective value standing in for designs that fail to solve
+failedObjective = 1e10
+
+
+#---------------------------------------------
+# Derived Quantities
+#---------------------------------------------
+def specificImpulse(solvedVars):
+    """Isp = F / (mdot * g_0)"""
+    return solvedVars["F"] / (solvedVars["mdot"] * g_0)
+
+# Quantities usable as objectives and constraints besides the symbols
+quantity_dict = {
+    "Isp"       :   specificImpulse,
+    "A_e/A_t"   :   lambda solvedVars: solvedVars["A_e"] / solvedVars["A_t"],
+}
+
+
+def quantity(name, solvedVars):
+    """Value of a symbol, a quantity_dict entry or a callable of the solved vars"""
+    if callable(name):
+        return name(solvedVars)
+    if name in quantity_dict:
+        return quantity_dict[name](solvedVars)
+    return solvedVars[name]
+
+
+#---------------------------------------------
+# Design Optimizer
+#---------------------------------------------
+def optimizeDesign(inputVars:dict, designVars:dict, objective, maximize=True, constraints=None,
+                   branch="supersonic", mixture=None, method="SLSQP", tol=1e-8, maxiter=200):
+    """
+    Searches design inputs for the best objective
+
+    designVars maps each searched input to its (lower, upper) bounds, and
+    inputVars holds the fixed inputs. objective and the keys of constraints
+    are symbols, quantity_dict names such as Isp, or callables of the dict
+    of solved vars. constraints maps each to (lower, upper) bounds, either
+    of which may be None.
+
+    The search runs scipy.optimize.minimize over design vars scaled to
+    [0, 1]. Every solve starts its iterative steps from the previous
+    solution, and repeated points are not solved again.
+
+    Returns a dict of the best design inputs, all solved vars there, the
+    objective value, success, the optimizer message and the solve count.
+    """
+    from scipy.optimize import minimize
+
+    # Raises ValueError for design vars without usable bounds
+    for var, (lower, upper) in designVars.items():
+        if not lower < upper:
+            raise ValueError(f"{var} bounds must satisfy lower < upper")
+
+    names = list(designVars)
+    lower = np.array([designVars[var][0] for var in names], dtype=float)
+    span = np.array([designVars[var][1] for var in names], dtype=float) - lower
+
+    fixedVars = {k: v for k, v in inputVars.items() if v is not None and k not in designVars}
+    sign = -1.0 if maximize else 1.0
+
+    # Last solved point, its vars and the warm start for the next solve
+    last = {"x": None, "vars": None}
+    guesses = {}
+    solves = 0
+
+    def solve(x):
+        nonlocal guesses, solves
+        if last["x"] is not None and np.array_equal(x, last["x"]):
+            return last["vars"]
+
+        design = dict(zip(names, lower + np.clip(x, 0, 1) * span))
+        try:
+            derivedVars = equationSolver({**fixedVars, **design}, branch=branch, mixture=mixture, guesses=guesses)
+        except (ValueError, ArithmeticError) as error:
+            logger.debug("Design %s failed to solve: %s", design, error)
+            derivedVars = {}
+        solves += 1
+
+        solvedVars = {**{k: asValue(v) for k, v in fixedVars.items()}, **design, **derivedVars}
+        if derivedVars:
+            guesses = derivedVars
+
+        last["x"], last["vars"] = np.array(x), solvedVars
+        return solvedVars
+
+    def evaluate(name, x):
+        try:
+            value = float(quantity(name, solve(x)))
+        except KeyError:
+            return np.nan
+        return value
+
+    def objectiveRunner(x):
+        value = evaluate(objective, x)
+        return sign * value / scale if np.isfinite(value) else failedObjective
+
+    x0 = np.full(len(names), 0.5)
+    for var, value in inputVars.items():
+        if var in designVars and value is not None:
+            x0[names.index(var)] = np.clip((value - designVars[var][0]) / (designVars[var][1] - designVars[var][0]), 0, 1)
+
+    # Objective scaled to order one at the starting point
+    start = evaluate(objective, x0)
+
+    # Raises ValueError if the objective cannot be evaluated at the start
+    if not np.isfinite(start):
+        raise ValueError(f"Objective {objective!r} is not determined at the starting design")
+    scale = abs(start) or 1.0
+
+    constraintList = []
+    for name, (low, high) in (constraints or {}).items():
+        if low is not None:
+            constraintList.append({"type": "ineq", "fun": lambda x, name=name, low=low: bounded(evaluate(name, x) - low, low)})
+        if high is not None:
+            constraintList.append({"type": "ineq", "fun": lambda x, name=name, high=high: bounded(high - evaluate(name, x), high)})
+
+    result = minimize(
+        objectiveRunner, x0, method=method, bounds=[(0, 1)] * len(names),
+        constraints=constraintList, tol=tol, options={"maxiter": maxiter},
+    )
+
+    solvedVars = solve(result.x)
+    design = {var: solvedVars[var] for var in names}
+    logger.info("Optimization finished after %d solves: %s", solves, result.message)
+
+    return {
+        "design"    :   design,
+        "vars"      :   solvedVars,
+        "objective" :   evaluate(objective, result.x),
+        "success"   :   bool(result.success),
+        "message"   :   result.message,
+        "solves"    :   solves,
+    }
+
+
+def bounded(margin, bound):
+    """Constraint margin relative to its bound, failed solves count as violated"""
+    if not np.isfinite(margin):
+        return -1.0
+    return margin / (abs(bound) or 1.0)
@@ -0,0 +1,145 @@
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .solver import equationSolver, solvePlan, constantVars, asValue
+
+
+#---------------------------------------------
+# Solver Pool
+#---------------------------------------------
+class SolverPool:
+    """
+    Solves large case sets across a pool of worker processes
+
+    Inputs and results live in shared-memory buffers with one row per
+    symbol and one column per case. Each worker solves a contiguous slice of
+    cases and writes its results straight into its slice of the output
+    buffer, so nothing but slice bounds is pickled and the output order
+    does not depend on which worker finishes first.
+    """
+
+    def __init__(self, workers=None, branch="supersonic"):
+        self.workers = workers or multiprocessing.cpu_count()
+        self.branch = branch
+
+        self.executor = ProcessPoolExecutor(self.workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Shuts the worker processes down"""
+        self.executor.shutdown()
+
+    #---------------------------------------------
+    # Solve
+    #---------------------------------------------
+    def solve(self, inputVars:dict, chunkSize=None, branch=None):
+        """
+        Solves every case in inputVars, same inputs and results as equationSolver
+
+        chunkSize is the number of cases per task, by default the cases are
+        split evenly across the workers. branch overrides the pool's branch
+        for this solve.
+        """
+
+        # Raises TypeError if inputVars is not a dict
+        if not isinstance(inputVars, dict):
+            raise TypeError("inputVars must be a dict")
+
+        branch = self.branch if branch is None else branch
+
+        inputVars = {k: asValue(v) for k, v in inputVars.items() if v is not None}
+        knownVars = {**inputVars, **{k: v for k, v in constantVars.items() if v is not None}}
+
+        shape = np.broadcast(*inputVars.values()).shape
+        n = math.prod(shape)
+
+        inSymbols = list(inputVars)
+        outSymbols = [unknown for _, unknowns in solvePlan(frozenset(knownVars)) for unknown in unknowns]
+
+        chunkSize = chunkSize or max(1, math.ceil(n / self.workers))
+
+        inShm = shared_memory.SharedMemory(create=True, size=max(1, len(inSymbols) * n * 8))
+        outShm = shared_memory.SharedMemory(create=True, size=max(1, len(outSymbols) * n * 8))
+
+        try:
+            inputs = np.ndarray((len(inSymbols), n), dtype=float, buffer=inShm.buf)
+            for i, symbol in enumerate(inSymbols):
+                inputs[i] = np.broadcast_to(inputVars[symbol], shape).reshape(n)
+
+            outputs = np.ndarray((len(outSymbols), n), dtype=float, buffer=outShm.buf)
+            outputs[:] = np.nan
+
+            futures = [
+                self.executor.submit(
+                    solveSlice,
+                    inShm.name, outShm.name, n, inSymbols, outSymbols,
+                    start, min(start + chunkSize, n), branch,
+                )
+                for start in range(0, n, chunkSize)
+            ]
+
+            # Raises the first worker exception, if any
+            for future in futures:
+                future.result()
+
+            derivedVars = {symbol: outputs[j].reshape(shape).copy() for j, symbol in enumerate(outSymbols)}
+
+            # Buffer views must be gone before the block is closed
+            del inputs, outputs
+        finally:
+            inShm.close()
+            inShm.unlink()
+            outShm.close()
+            outShm.unlink()
+
+        return derivedVars
+
+
+#---------------------------------------------
+# Parallel Solve
+#---------------------------------------------
+def parallelSolve(inputVars:dict, workers=None, chunkSize=None, branch="supersonic"):
+    """Solves a case set on a temporary SolverPool"""
+
+    with SolverPool(workers, branch) as pool:
+        return pool.solve(inputVars, chunkSize)
+
+
+#---------------------------------------------
+# Worker
+#---------------------------------------------
+def solveSlice(inName, outName, n, inSymbols, outSymbols, start, stop, branch):
+    """Solves cases start:stop from the shared input buffer into the shared output buffer"""
+
+    # Workers share the parent's resource tracker, only the parent unlinks
+    inShm = shared_memory.SharedMemory(name=inName)
+    outShm = shared_memory.SharedMemory(name=outName)
+
+    try:
+        inputs = np.ndarray((len(inSymbols), n), dtype=float, buffer=inShm.buf)
+        outputs = np.ndarray((len(outSymbols), n), dtype=float, buffer=outShm.buf)
+
+        derivedVars = equationSolver(
+            {symbol: inputs[i, start:stop] for i, symbol in enumerate(inSymbols)},
+            branch=branch,
+        )
+
+        for j, symbol in enumerate(outSymbols):
+            outputs[j, start:stop] = derivedVars[symbol]
+
+        # Buffer views must be gone before the block is closed
+        del inputs, outputs, derivedVars
+    finally:
+        inShm.close()
+        outShm.close()
+
+    return stop - start
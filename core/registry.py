@@ -0,0 +1,109 @@
+import inspect
+from collections import namedtuple
+
+import core.physics as physics
+from core.jacobians import jacobian_dict
+
+
+# Physics function, its gradient, its arg names and their state slots
+EquationBinding = namedtuple("EquationBinding", ["function", "gradient", "argNames", "argIndex"])
+
+
+#---------------------------------------------
+# Equation Registry
+#---------------------------------------------
+class Registry:
+    """
+    Compiled form of the equation set
+
+    Every symbol gets an integer index and bit, every equation a bitmask of
+    its vars, so the unknowns of an equation given a mask of known symbols
+    are eqMask & ~known. Aliased vars are resolved once to the physics
+    argument names, and each equation is bound to its physics function,
+    its gradient and the state slots of its args.
+    """
+
+    def __init__(self, eqVars_dict, varAlias_dict, eqID_normalize, constantVars):
+        # Symbol indices, also the state vector slots
+        self.symbols = tuple(sorted(set().union(*eqVars_dict.values())))
+        self.index = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        # Equation masks, in eqVars_dict order
+        self.equations = tuple(eqVars_dict)
+        self.eqMask = {eqID: self.mask(eqVars) for eqID, eqVars in eqVars_dict.items()}
+
+        # Specific var : generic alias
+        self.generic = {alias: generic for generic, aliases in varAlias_dict.items() for alias in aliases}
+
+        # eqID : {var : physics arg name}
+        self.argNames = {
+            eqID: {var: self.generic.get(var, var) if eqID in eqID_normalize else var for var in eqVars}
+            for eqID, eqVars in eqVars_dict.items()
+        }
+
+        # var : eqIDs containing it
+        self.symbolEqs = {
+            symbol: tuple(eqID for eqID in self.equations if self.eqMask[eqID] >> i & 1)
+            for symbol, i in self.index.items()
+        }
+
+        self.constantMask = self.mask(k for k, v in constantVars.items() if v is not None)
+
+        self.bindings = {eqID: self.bind(eqID) for eqID in self.equations}
+
+    #---------------------------------------------
+    # Masks
+    #---------------------------------------------
+    def mask(self, symbols):
+        """Bitmask of symbols, names outside the equation set are ignored"""
+        mask = 0
+        for symbol in symbols:
+            i = self.index.get(symbol)
+            if i is not None:
+                mask |= 1 << i
+        return mask
+
+    def symbolsOf(self, mask):
+        """Symbols of a bitmask, in index order"""
+        symbols = []
+        while mask:
+            low = mask & -mask
+            symbols.append(self.symbols[low.bit_length() - 1])
+            mask ^= low
+        return tuple(symbols)
+
+    def unknownMask(self, eqID, known):
+        """Bitmask of an equation's vars missing from the known mask"""
+        return self.eqMask[eqID] & ~known
+
+    def unknownCount(self, eqID, known):
+        """Number of an equation's vars missing from the known mask"""
+        return bin(self.eqMask[eqID] & ~known).count("1")
+
+    #---------------------------------------------
+    # Bindings
+    #---------------------------------------------
+    def argName(self, eqID, var):
+        """Returns the physics argument name of a var within an equation"""
+        return self.argNames[eqID][var]
+
+    def bind(self, eqID):
+        """Binds an equation's args positionally to state vector slots"""
+        function = getattr(physics, eqID.split("@")[0])
+        argNames = tuple(inspect.signature(function).parameters)
+        argVars = {name: var for var, name in self.argNames[eqID].items()}
+
+        return EquationBinding(
+            function,
+            jacobian_dict[function.__name__],
+            argNames,
+            tuple(self.index[argVars[name]] for name in argNames),
+        )
+
+
+#---------------------------------------------
+# Single Bit
+#---------------------------------------------
+def singleBit(mask):
+    """True when exactly one bit of mask is set"""
+    return mask != 0 and mask & (mask - 1) == 0
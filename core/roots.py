@@ -0,0 +1,186 @@
+import math
+
+import numpy
+
+
+# Area-Mach branches
+branches = ("subsonic", "supersonic")
+
+
+#---------------------------------------------
+# Area Function
+#---------------------------------------------
+def areaFunction(Ma, gamma):
+    """
+    Area ratio to the sonic area
+
+    A / A* = 1 / Ma * [2 / (gamma + 1) * (1 + (gamma - 1) / 2 * Ma ^ 2)] ^ ((gamma + 1) / (2 * (gamma - 1)))
+    """
+    return 1 / Ma * (2 / (gamma + 1) * (1 + (gamma - 1) / 2 * Ma ** 2)) ** ((gamma + 1) / (2 * (gamma - 1)))
+
+
+#---------------------------------------------
+# Bracketed Area-Mach Roots
+#---------------------------------------------
+def areaMachRoots(areaRatio, gamma, tol=1e-13):
+    """
+    Both Mach numbers with A / A* = areaRatio
+
+    Returns (subsonic, supersonic), NaN where areaRatio < 1.
+    """
+    return (
+        areaMachRoot(areaRatio, gamma, "subsonic", tol),
+        areaMachRoot(areaRatio, gamma, "supersonic", tol),
+    )
+
+def areaMachRoot(areaRatio, gamma, branch="supersonic", tol=1e-13, info=None):
+    """
+    Mach number on one branch with A / A* = areaRatio
+
+    Newton on ln(A / A*) against ln(Ma), which is close to linear on both
+    branches, started from the better of the near-sonic and asymptotic
+    estimates. Each case keeps a bracket, (0, 1] for the subsonic root and
+    [1, inf) for the supersonic root, and bisects whenever a step leaves it.
+    Iteration stops once every step is below tol relative. Scalars are
+    iterated on plain floats. Returns NaN where areaRatio < 1.
+
+    info is an optional dict, nfev is set to the areaFunction evaluations.
+    """
+    if numpy.ndim(areaRatio) == 0 and numpy.ndim(gamma) == 0:
+        root, nfev = _scalarRoot(float(areaRatio), float(gamma), branch == "supersonic", tol)
+    else:
+        root, nfev = _arrayRoot(areaRatio, gamma, branch == "supersonic", tol)
+
+    if info is not None:
+        info["nfev"] = nfev
+    return root
+
+def _startingPoints(areaRatio, gamma, increasing, sqrt):
+    """
+    Near-sonic and asymptotic root estimates
+
+    A / A* = 1 + 2 / (gamma + 1) * (Ma - 1) ^ 2 near Ma = 1,
+    A / A* = c / Ma for small Ma and A / A* = d * Ma ^ (2e - 1) for large Ma
+    """
+    e = (gamma + 1) / (2 * (gamma - 1))
+    offset = sqrt((areaRatio - 1) * (gamma + 1) / 2)
+
+    if increasing:
+        return 1 + offset, (areaRatio / ((gamma - 1) / (gamma + 1)) ** e) ** (1 / (2 * e - 1))
+    return 1 - offset, (2 / (gamma + 1)) ** e / areaRatio
+
+def _logSlope(Ma, gamma):
+    """d ln(A / A*) / d ln(Ma) = (Ma ^ 2 - 1) / (1 + (gamma - 1) / 2 * Ma ^ 2)"""
+    return (Ma ** 2 - 1) / (1 + (gamma - 1) / 2 * Ma ** 2)
+
+def _scalarRoot(areaRatio, gamma, increasing, tol, maxiter=100):
+    """Safeguarded log-space Newton on plain floats, returns (root, evaluations)"""
+    if not (areaRatio >= 1 and math.isfinite(areaRatio) and gamma > 1):
+        return math.nan, 0
+
+    # Python floats raise on overflow, the array path saturates instead
+    if areaRatio > 1e100:
+        root, nfev = _arrayRoot(areaRatio, gamma, increasing, tol)
+        return float(root), nfev
+    if areaRatio == 1:
+        return 1.0, 0
+
+    lo, hi = (1.0, math.inf) if increasing else (0.0, 1.0)
+    target = math.log(areaRatio)
+
+    # Better of the two estimates, clipped into the bracket
+    nfev = 0
+    best = None
+    for Ma in _startingPoints(areaRatio, gamma, increasing, math.sqrt):
+        if not lo < Ma < hi:
+            continue
+        residual = math.log(areaFunction(Ma, gamma)) - target
+        nfev += 1
+        if best is None or abs(residual) < abs(best[1]):
+            best = (Ma, residual)
+    Ma, residual = best if best is not None else (0.5 if not increasing else 2.0, None)
+
+    for _ in range(maxiter):
+        if residual is None:
+            residual = math.log(areaFunction(Ma, gamma)) - target
+            nfev += 1
+        if (residual < 0) == increasing:
+            lo = Ma
+        else:
+            hi = Ma
+
+        step = Ma * math.exp(-residual / _logSlope(Ma, gamma))
+        if abs(step - Ma) <= tol * Ma:
+            return step, nfev
+
+        if not lo < step < hi:
+            step = 0.5 * (lo + hi) if math.isfinite(hi) else 2 * Ma
+        Ma, residual = step, None
+
+    return Ma, nfev
+
+def _arrayRoot(areaRatio, gamma, increasing, tol, maxiter=100):
+    """Safeguarded log-space Newton on every case at once, returns (roots, evaluations)"""
+    areaRatio, gamma = numpy.broadcast_arrays(numpy.asarray(areaRatio, dtype=float), numpy.asarray(gamma, dtype=float))
+    valid = (areaRatio >= 1) & numpy.isfinite(areaRatio) & (gamma > 1)
+
+    with numpy.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        target = numpy.log(areaRatio)
+        lo = numpy.full(areaRatio.shape, 1.0 if increasing else 0.0)
+        hi = numpy.full(areaRatio.shape, numpy.inf if increasing else 1.0)
+
+        # Better of the two estimates, clipped into the bracket
+        guesses = [
+            numpy.clip(Ma, numpy.nextafter(1.0, 2.0) if increasing else 1e-300, numpy.inf if increasing else numpy.nextafter(1.0, 0.0))
+            for Ma in _startingPoints(areaRatio, gamma, increasing, numpy.sqrt)
+        ]
+        residuals = [numpy.log(areaFunction(Ma, gamma)) - target for Ma in guesses]
+        nfev = 2
+        first = numpy.abs(residuals[0]) <= numpy.abs(residuals[1])
+        Ma = numpy.where(first, guesses[0], guesses[1])
+        residual = numpy.where(first, residuals[0], residuals[1])
+
+        active = valid & (areaRatio != 1)
+        for _ in range(maxiter):
+            below = (residual < 0) == increasing
+            lo = numpy.where(below, Ma, lo)
+            hi = numpy.where(below, hi, Ma)
+
+            step = Ma * numpy.exp(-residual / _logSlope(Ma, gamma))
+            converged = numpy.abs(step - Ma) <= tol * Ma
+
+            fallback = numpy.where(numpy.isfinite(hi), 0.5 * (lo + hi), 2 * Ma)
+            step = numpy.where(converged | ((step > lo) & (step < hi)), step, fallback)
+
+            Ma = numpy.where(active, step, Ma)
+            active &= ~converged
+            if not active.any():
+                break
+
+            residual = numpy.log(areaFunction(Ma, gamma)) - target
+            nfev += 1
+
+    root = numpy.where(valid, numpy.where(areaRatio == 1, 1.0, Ma), numpy.nan)
+    return (root[()] if root.ndim == 0 else root), nfev
+
+
+#---------------------------------------------
+# Area-Mach Relation
+#---------------------------------------------
+def areaMachRelation_Ma_e(A_t, A_e, Ma_t, gamma, branch="supersonic", info=None):
+    """Ma_e on the selected branch, A_e / A* = A_e / A_t * A_t / A*"""
+    return areaMachRoot(A_e / A_t * areaFunction(Ma_t, gamma), gamma, branch, info=info)
+
+def areaMachRelation_Ma_t(A_t, A_e, Ma_e, gamma, branch="supersonic", info=None):
+    """Ma_t on the selected branch, A_t / A* = A_t / A_e * A_e / A*"""
+    return areaMachRoot(A_t / A_e * areaFunction(Ma_e, gamma), gamma, branch, info=info)
+
+
+#---------------------------------------------
+# Bracketed Root Registry
+#---------------------------------------------
+# (function name, unknown arg) : bracketed solver taking the remaining args and a branch
+bracket_dict = {
+    ("areaMachRelation",        "Ma_e")     :   areaMachRelation_Ma_e,
+    ("areaMachRelation",        "Ma_t")     :   areaMachRelation_Ma_t,
+}
@@ -0,0 +1,111 @@
+import numpy as np
+
+from .solver import (
+    equationSolver,
+    equationGradient,
+    solvePlan,
+    constantVars,
+    registry,
+    asValue,
+)
+from .gases import mixtureInputs
+
+
+#---------------------------------------------
+# Sensitivities
+#---------------------------------------------
+def equationSensitivities(inputVars:dict, derivedVars:dict, wrt=None):
+    """
+    Derivatives of every derived var with respect to the inputs
+
+    Applies the implicit function theorem along the solve plan of inputVars,
+    at the solution derivedVars: for a step solving f = 0 for u,
+    du/dx = -(df/dk * dk/dx) / (df/du) over the vars k already known, and
+    a coupled block solves J_u * du/dx = -J_k * dk/dx as one linear system
+    per case. No equation is re-solved.
+
+    wrt is an optional list of inputs to differentiate by, all inputs by
+    default. Returns {derived var : {input : derivative}}, each derivative
+    a scalar or an array of the broadcast input shape.
+    """
+    inputVars = {k: asValue(v) for k, v in inputVars.items() if v is not None}
+    wrt = list(inputVars if wrt is None else wrt)
+
+    # Raises ValueError when differentiating by something that is not an input
+    unknownInputs = [var for var in wrt if var not in inputVars]
+    if unknownInputs:
+        raise ValueError(f"{unknownInputs} are not inputs")
+
+    knownVars = {**inputVars, **{k: v for k, v in constantVars.items() if v is not None}}
+    shape = np.broadcast(*knownVars.values(), *derivedVars.values()).shape
+
+    state = [knownVars.get(symbol, derivedVars.get(symbol)) for symbol in registry.symbols]
+
+    # Tangent of every known symbol index, one entry per wrt input
+    tangents = {}
+    for var in knownVars:
+        if var in registry.index:
+            tangents[registry.index[var]] = [float(var == x) for x in wrt]
+
+    for eqIDs, unknowns in solvePlan(frozenset(knownVars)):
+        unknownIndex = [registry.index[var] for var in unknowns]
+        partials = [equationGradient(eqID, state) for eqID in eqIDs]
+
+        # Right-hand side, -df/dk * dk/dx over the known vars of each equation
+        rhs = [
+            [-sum(p[w] * tangents[w][j] for w in p if w in tangents) for j in range(len(wrt))]
+            for p in partials
+        ]
+
+        if len(eqIDs) == 1:
+            tangents[unknownIndex[0]] = [r / partials[0][unknownIndex[0]] for r in rhs[0]]
+            continue
+
+        # Coupled block, cases stacked in front of the m x m system
+        m = len(unknowns)
+        J = np.zeros(shape + (m, m))
+        B = np.zeros(shape + (m, len(wrt)))
+        for i, p in enumerate(partials):
+            for k, u in enumerate(unknownIndex):
+                J[..., i, k] = p.get(u, 0.0)
+            for j in range(len(wrt)):
+                B[..., i, j] = rhs[i][j]
+
+        with np.errstate(invalid="ignore"):
+            try:
+                X = np.linalg.solve(J, B)
+            except np.linalg.LinAlgError:
+                X = np.full(B.shape, np.nan)
+
+        for k, u in enumerate(unknownIndex):
+            tangents[u] = [X[..., k, j][()] for j in range(len(wrt))]
+
+    return {
+        var: {x: tangents[registry.index[var]][j] for j, x in enumerate(wrt)}
+        for var in derivedVars
+        if registry.index.get(var) in tangents and var not in knownVars
+    }
+
+
+#---------------------------------------------
+# Solve With Sensitivities
+#---------------------------------------------
+def sensitivitySolver(inputVars:dict, wrt=None, branch="supersonic", cancelEvent=None, mixture=None):
+    """
+    Solves like equationSolver and returns (derivedVars, sensitivities)
+
+    With a mixture, the looked-up gamma and M are treated as inputs, so
+    their sensitivities are available, but their dependence on the
+    stagnation temperature is not chained into d/dT_c.
+    """
+    inputVars = {k: v for k, v in inputVars.items() if v is not None}
+
+    mixtureVars = {}
+    if mixture is not None:
+        mixtureVars = {k: v for k, v in mixtureInputs(inputVars, mixture).items() if k not in inputVars}
+        inputVars = {**inputVars, **mixtureVars}
+
+    derivedVars = equationSolver(inputVars, branch=branch, cancelEvent=cancelEvent)
+    sensitivities = equationSensitivities(inputVars, derivedVars, wrt)
+
+    return {**{k: asValue(v) for k, v in mixtureVars.items()}, **derivedVars}, sensitivities
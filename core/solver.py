@@ -1,10 +1,17 @@
-from scipy.optimize import fsolve
 import numpy as np
-import inspect
+import logging
+import time
+from functools import lru_cache
+from itertools import combinations
 
-import core.physics as physics
+from core.inverses import inverse_dict
+from core.roots import bracket_dict, branches
+from core.registry import Registry, singleBit
+from core.gases import mixtureInputs
 
 
+logger = logging.getLogger(__name__)
+
 # Equation var sets
 eqVars_dict = {
     "specificGasConstant"       :   frozenset({"M", "R"}),                                              # Specific Gas Constant
@@ -28,7 +35,33 @@ constantVars = {
 
 # Var initial guesses
 guess_dict = {
-    "fddf0"     :   15
+    "fddf0"     :   15,
+    "Ma_e"      :   2.0,
+    "gamma"     :   1.3,
+}
+
+# Mach initial guesses per Area-Mach branch
+branchGuess_dict = {
+    "subsonic"      :   0.5,
+    "supersonic"    :   2.0,
+}
+
+# Further Mach starts per branch, tried for block cases the first guess does not solve
+branchRetry_dict = {
+    "subsonic"      :   (0.15, 0.85),
+    "supersonic"    :   (4.0, 1.3, 8.0),
+}
+
+# Open Mach interval per Area-Mach branch
+branchBound_dict = {
+    "subsonic"      :   (0.0, 1.0),
+    "supersonic"    :   (1.0, np.inf),
+}
+
+# Open physical interval of vars a block result must stay in
+bound_dict = {
+    "A_t"       :   (0.0, np.inf),
+    "A_e"       :   (0.0, np.inf),
 }
 
 # Var aliases
@@ -47,94 +80,716 @@ eqID_normalize = {
     "flowRelation@Exit",
 }
 
+# Eq's implied by other eq's, redundant when solved together with them
+eqID_dependent = {
+    "flowRelation@Exit"         :   frozenset({"temperatureRatio@Exit", "pressureRatio@Exit"}),
+}
+
+
+#---------------------------------------------
+# Lazy SciPy
+#---------------------------------------------
+# SciPy is only imported once an equation actually needs iterating
+def fsolve(*args, **kwargs):
+    """scipy.optimize.fsolve, imported on first use"""
+    from scipy.optimize import fsolve
+    return fsolve(*args, **kwargs)
+
+def newton(*args, **kwargs):
+    """scipy.optimize.newton, imported on first use"""
+    from scipy.optimize import newton
+    return newton(*args, **kwargs)
+
+
+#---------------------------------------------
+# Exceptions
+#---------------------------------------------
+class SolveCancelled(Exception):
+    """Raised when a solve is cancelled before it finishes"""
+
+
+#---------------------------------------------
+# Solve Stats
+#---------------------------------------------
+class SolveStats:
+    """
+    Instrumentation of a single solve, filled in by equationSolver
+
+    steps holds one dict per plan step with its eqIDs and unknowns, the
+    method used (inverse, bracket, fsolve, newton or block), the residual
+    evaluations it took (nfev, areaFunction evaluations for a bracket),
+    whether every case converged and its wall time in seconds.
+    """
+
+    def __init__(self):
+        self.sweeps = 0
+        self.steps = []
+        self.seconds = 0.0
+
+    @property
+    def attempted(self):
+        """Number of plan steps run"""
+        return len(self.steps)
+
+    @property
+    def solved(self):
+        """Number of plan steps where every case converged"""
+        return sum(step["converged"] for step in self.steps)
+
+    @property
+    def nfev(self):
+        """Residual evaluations over the whole solve"""
+        return sum(step["nfev"] for step in self.steps)
+
+    def slowest(self, count=5):
+        """The count steps that took longest"""
+        return sorted(self.steps, key=lambda step: step["seconds"], reverse=True)[:count]
+
+    def __repr__(self):
+        return (
+            f"SolveStats(sweeps={self.sweeps}, attempted={self.attempted}, solved={self.solved}, "
+            f"nfev={self.nfev}, seconds={self.seconds:.6f})"
+        )
+
+
+#---------------------------------------------
+# Solve Plan
+#---------------------------------------------
+class SolvePlan(tuple):
+    """Tuple of (eqIDs, unknowns) steps that also records the sweeps it took to build"""
+
+    def __new__(cls, steps, sweeps):
+        plan = super().__new__(cls, steps)
+        plan.sweeps = sweeps
+        return plan
+
+
+#---------------------------------------------
+# Solve Planner
+#---------------------------------------------
+@lru_cache(maxsize=256)
+def solvePlan(knownSymbols:frozenset):
+    """
+    Builds an ordered solve plan for a set of known symbols
+
+    Returns a SolvePlan of (eqIDs, unknowns) steps. Most steps solve one equation
+    for its single unknown; when that stalls, coupled blocks of equations are
+    solved together for their shared unknowns. Plans are cached by the
+    frozenset of known symbols.
+    """
+
+    known = registry.mask(knownSymbols)
+    plan = []
+
+    # Protection against infinite loops
+    iteration_count = 0
+    max_iterations = 100
+
+    running = True
+    while running and iteration_count <= max_iterations:
+        running = False
+        iteration_count += 1
+
+        for eqID, eqMask in registry.eqMask.items():
+            eqMask_unknown = eqMask & ~known
+
+            if not singleBit(eqMask_unknown):
+                continue
+
+            unknown = registry.symbols[eqMask_unknown.bit_length() - 1]
+            plan.append(((eqID,), (unknown,)))
+            known |= eqMask_unknown
+            running = True
+
+        # Sweep stalled, look for coupled blocks
+        if not running:
+            for eqIDs, unknowns in coupledBlocks(known):
+                plan.append((eqIDs, unknowns))
+                known |= registry.mask(unknowns)
+                running = True
+
+    return SolvePlan(plan, iteration_count)
+
+
+#---------------------------------------------
+# Coupled Blocks
+#---------------------------------------------
+def coupledBlocks(known, candidates=None):
+    """
+    Finds coupled blocks of equations that can be solved together
+
+    The equations left with two or more unknowns are matched to unknowns,
+    and the strongly connected components of the resulting dependency graph
+    are returned in solve order as (eqIDs, unknowns) pairs. Blocks that
+    depend on an unmatched unknown are underdetermined and left out.
+    known is a registry bitmask of known symbols. candidates optionally
+    limits the search to a set of eqIDs.
+    """
+
+    eqUnknowns = {}
+    for eqID, eqMask in registry.eqMask.items():
+        if candidates is not None and eqID not in candidates:
+            continue
+
+        eqMask_unknown = eqMask & ~known
+        if eqMask_unknown and not singleBit(eqMask_unknown):
+            eqUnknowns[eqID] = registry.symbolsOf(eqMask_unknown)
+
+    # Implied eq's add no information once any source is in a block or already satisfied,
+    # together with that source they would make the block singular
+    for eqID, sources in eqID_dependent.items():
+        if eqID in eqUnknowns and any(
+            source in eqUnknowns or registry.unknownCount(source, known) == 0 for source in sources
+        ):
+            del eqUnknowns[eqID]
+
+    # Maximum matching of equations to unknowns (augmenting paths)
+    matchedEq = {}
+
+    def augment(eqID, visited):
+        for var in eqUnknowns[eqID]:
+            if var in visited:
+                continue
+            visited.add(var)
+            if var not in matchedEq or augment(matchedEq[var], visited):
+                matchedEq[var] = eqID
+                return True
+        return False
+
+    for eqID in eqUnknowns:
+        augment(eqID, set())
+
+    matchedVar = {eqID: var for var, eqID in matchedEq.items()}
+
+    # Each matched equation depends on the equations matched to its other unknowns
+    dependencies = {
+        eqID: [matchedEq[var] for var in eqUnknowns[eqID] if var in matchedEq and matchedEq[var] != eqID]
+        for eqID in matchedVar
+    }
+
+    # Tarjan's strongly connected components, emitted dependencies first
+    index = {}
+    lowlink = {}
+    stack = []
+    onStack = set()
+    components = []
+
+    def strongConnect(eqID):
+        index[eqID] = lowlink[eqID] = len(index)
+        stack.append(eqID)
+        onStack.add(eqID)
+
+        for dep in dependencies[eqID]:
+            if dep not in index:
+                strongConnect(dep)
+                lowlink[eqID] = min(lowlink[eqID], lowlink[dep])
+            elif dep in onStack:
+                lowlink[eqID] = min(lowlink[eqID], index[dep])
+
+        if lowlink[eqID] == index[eqID]:
+            component = []
+            while True:
+                member = stack.pop()
+                onStack.discard(member)
+                component.append(member)
+                if member == eqID:
+                    break
+            components.append(component)
+
+    for eqID in eqUnknowns:
+        if eqID in matchedVar and eqID not in index:
+            strongConnect(eqID)
+
+    # Keep blocks whose unknowns are all determined by themselves or earlier blocks
+    blocks = []
+    solved = set()
+    for component in components:
+        eqIDs = tuple(eqID for eqID in eqUnknowns if eqID in component)
+        unknowns = tuple(matchedVar[eqID] for eqID in eqIDs)
+        needed = {var for eqID in eqIDs for var in eqUnknowns[eqID]}
+
+        if needed <= solved | set(unknowns):
+            blocks.append((eqIDs, unknowns))
+            solved.update(unknowns)
+
+    return blocks
+
 
 #---------------------------------------------
 # Iterative Solver
 #---------------------------------------------
-def equationSolver(inputVars:dict):
+def equationSolver(inputVars:dict, branch="supersonic", cancelEvent=None, stats=None, mixture=None, guesses=None):
     '''
     Solves equations
+
+    Any input may be an array, in which case all cases are solved in one
+    vectorized pass and every derived var is returned as an array of the
+    broadcast input shape.
+
+    branch selects the subsonic or supersonic root of the Area-Mach relation.
+    cancelEvent is an optional threading.Event checked between solve steps,
+    SolveCancelled is raised once it is set.
+    stats is an optional SolveStats, filled in with per-step instrumentation.
+    mixture names a gas property table, gamma and M missing from the inputs
+    are then looked up at the stagnation temperature and returned as derived.
+    guesses is an optional dict of starting values for iteratively solved
+    vars, e.g. a previous solution, used in place of guess_dict.
     '''
 
     # Raises TypeError if inputVars or derivedVars are not a dict
     if not isinstance(inputVars, dict):
         raise TypeError("inputVars must be a dict")
 
-    running = True
-    derivedVars = {}
+    # Raises ValueError if branch is not an Area-Mach branch
+    if branch not in branches:
+        raise ValueError(f"branch must be one of {branches}")
 
-    # Protection against infinite loops
-    iteration_count = 0
-    max_iterations = 100
+    # Gas properties from the mixture table
+    mixtureVars = {}
+    if mixture is not None:
+        mixtureVars = {k: v for k, v in mixtureInputs(inputVars, mixture).items() if inputVars.get(k) is None}
+        inputVars = {**inputVars, **mixtureVars}
 
-    while running and iteration_count <= max_iterations:
-        running = False
+    #Merge all known vars into a single dict
+    knownVars = {
+        **{k:asValue(v) for k,v in inputVars.items() if v is not None},
+        **{k:v for k,v in constantVars.items() if v is not None}}
 
+    # Raises ValueError if array inputs do not broadcast together
+    shape = np.broadcast(*knownVars.values()).shape
 
-        for eqID, eqVars in eqVars_dict.items():
-            #Merge all known vars into a single dict
-            knownVars = {
-                **{k:v for k,v in inputVars.items() if v is not None},
-                **{k:v for k,v in derivedVars.items() if v is not None},
-                **{k:v for k,v in constantVars.items() if v is not None}}
+    # State vector indexed by symbol
+    state = [knownVars.get(symbol) for symbol in registry.symbols]
 
-            #Find the unknown vars for this equation
-            eqVars_unknown = eqVars - knownVars.keys()
+    derivedVars = {k: asValue(v) for k, v in mixtureVars.items()}
 
-            #Make dict of vars used by equation
-            usedVars = {var: knownVars.get(var, None) for var in eqVars}
+    plan = solvePlan(frozenset(knownVars))
+    debug = logger.isEnabledFor(logging.DEBUG)
 
-            if len(eqVars_unknown) != 1:
-                print(f"Skipping {eqID}: unknowns = {eqVars_unknown}")
-                continue  
+    # Step info and timing only when someone is listening
+    info = {} if stats is not None or debug else None
+    if stats is not None:
+        stats.sweeps = plan.sweeps
+        solveStart = time.perf_counter()
 
-            if len(eqVars_unknown) == 1:
-                unknown = list(eqVars_unknown)[0]
-                function = getattr(physics, eqID.split("@")[0])
+    for eqIDs, unknowns in plan:
+        if cancelEvent is not None and cancelEvent.is_set():
+            raise SolveCancelled()
 
-                usedVars = varNormalizer(eqID, usedVars)
+        if info is not None:
+            info.clear()
+            stepStart = time.perf_counter()
 
-                for generic, aliases in varAlias_dict.items():
-                    if unknown in aliases:
-                        unknown = generic
+        if len(eqIDs) == 1:
+            results = (equationStep(eqIDs[0], unknowns[0], state, branch, info, guesses),)
+        else:
+            results = blockStep(eqIDs, unknowns, state, branch, info, guesses)
 
-                if unknown in derivedVars:
-                    continue
+        for unknown, result in zip(unknowns, results):
+            state[symbolIndex_dict[unknown]] = result
+            derivedVars[unknown] = result
+
+        if info is not None:
+            seconds = time.perf_counter() - stepStart
+            info.setdefault("converged", all(np.all(np.isfinite(result)) for result in results))
+
+            if stats is not None:
+                stats.steps.append({"eqIDs": eqIDs, "unknowns": unknowns, **info, "seconds": seconds})
+
+            if debug:
+                logger.debug(
+                    "%s -> %s by %s, nfev=%d, converged=%s, %.3f ms",
+                    ", ".join(eqIDs), ", ".join(unknowns), info["method"], info["nfev"], info["converged"], seconds * 1e3,
+                )
 
-                #fsolve intermediary
-                def equationRunner(guess):
-                    usedVars_temp = usedVars.copy()
-                    usedVars_temp[unknown] = float(np.asarray(guess).item())
-
-                    valid_args = inspect.signature(function).parameters.keys()
-                    args = {k: v for k, v in usedVars_temp.items() if k in valid_args}
-
-                    return function(**args)
-                
-                guess = guess_dict.get(unknown, 1.0)
-                
-                result = fsolve(equationRunner, guess)[0]
-                if eqID in eqID_normalize:
-                    for generic, aliases in varAlias_dict.items():
-                        if unknown == generic:
-                            for alt in aliases:
-                                if alt in eqVars_dict[eqID]:
-                                    prev = derivedVars.get(alt)
-                                    if prev is None or not np.isclose(prev, result, rtol=1e-6, atol=1e-9):
-                                        derivedVars[alt] = result
-                                        running = True
-                
-                else:
-                    prev = derivedVars.get(unknown)
-                    if prev is None or not np.isclose(prev, result, rtol=1e-6, atol=1e-9):
-                        derivedVars[unknown] = result
-                        running = True
-
-                print("Running")
+    if stats is not None:
+        stats.seconds = time.perf_counter() - solveStart
+
+    # Batch results all share the input shape
+    if shape != ():
+        derivedVars = {k: np.broadcast_to(v, shape).copy() for k, v in derivedVars.items()}
 
     return derivedVars
 
 
+#---------------------------------------------
+# Input Values
+#---------------------------------------------
+def asValue(value):
+    """Returns scalars unchanged and sequences as float arrays"""
+    if np.ndim(value) == 0:
+        return value
+    return np.asarray(value, dtype=float)
+
+
+#---------------------------------------------
+# Initial Guesses
+#---------------------------------------------
+def defaultGuess(var, branch):
+    """
+    Starting value of an iteratively solved var without a given guess
+
+    Mach numbers start on the selected branch, away from the sonic point
+    where the Area-Mach relation has a zero derivative, other vars from
+    guess_dict by var name, then 1.0.
+    """
+    if registry.generic.get(var) == "Ma":
+        return branchGuess_dict[branch]
+    return guess_dict.get(var, 1.0)
+
+
+def varBounds(var, branch):
+    """Open interval var must lie in, Mach numbers on the selected branch"""
+    if registry.generic.get(var) == "Ma":
+        return branchBound_dict[branch]
+    return bound_dict.get(var, (-np.inf, np.inf))
+
+
+def initialGuess(var, guesses, default):
+    """Starting value of var from guesses, default where it has none or a non-finite one"""
+    guess = None if guesses is None else guesses.get(var)
+    if guess is None:
+        return default
+
+    guess = asValue(guess)
+    if np.ndim(guess) == 0:
+        return guess if np.isfinite(guess) else default
+    return np.where(np.isfinite(guess), guess, default)
+
+
+#---------------------------------------------
+# Equation Step
+#---------------------------------------------
+def equationStep(eqID, unknown, state, branch="supersonic", info=None, guesses=None):
+    """
+    Solves a single equation for its unknown, reading args from the state vector
+
+    info is an optional dict, filled in with the method used, the residual
+    evaluations taken (nfev) and, for iterative methods, convergence.
+    guesses optionally maps vars to starting values, scalars or arrays.
+    """
+
+    binding = binding_dict[eqID]
+    function = binding.function
+    gradient = binding.gradient
+
+    var = unknown
+    args = [state[i] for i in binding.argIndex]
+    position = binding.argIndex.index(symbolIndex_dict[var])
+    unknown = binding.argNames[position]
+    otherArgs = args[:position] + args[position + 1:]
+
+    # Closed-form inverse when one exists
+    inverse = inverse_dict.get((function.__name__, unknown))
+    if inverse is not None:
+        if info is not None:
+            info.update(method="inverse", nfev=0)
+        return inverse(*otherArgs)
+
+    # Bracketed root on the selected branch for multi-root unknowns
+    bracket = bracket_dict.get((function.__name__, unknown))
+    if bracket is not None:
+        if info is not None:
+            info.update(method="bracket")
+        return bracket(*otherArgs, branch=branch, info=info)
+
+    guess = initialGuess(var, guesses, defaultGuess(var, branch))
+    shape = np.broadcast(*otherArgs).shape
+
+    if shape == ():
+        #fsolve intermediary, guess arrives as a length 1 array
+        def equationRunner(guess):
+            args[position] = guess[0]
+            return function(*args)
+
+        def equationPrime(guess):
+            args[position] = guess[0]
+            return [[gradient(*args)[unknown]]]
+
+        root, fsolveInfo, ier, message = fsolve(equationRunner, guess, fprime=equationPrime, full_output=True)
+
+        if ier != 1:
+            logger.warning("%s did not converge for %s: %s", eqID, unknown, message)
+        if info is not None:
+            info.update(method="fsolve", nfev=fsolveInfo["nfev"], converged=ier == 1)
+
+        # An unconverged case is marked as NaN, like the batch paths
+        return root[0] if ier == 1 else np.nan
+
+    #newton intermediary, iterates every case at once
+    nfev = 0
+    def equationRunner(guess):
+        nonlocal nfev
+        nfev += 1
+        args[position] = guess
+        return function(*args)
+
+    def equationPrime(guess):
+        args[position] = guess
+        return gradient(*args)[unknown]
+
+    # Raises RuntimeError when no case converges
+    try:
+        root, converged, _ = newton(equationRunner, np.array(np.broadcast_to(guess, shape), dtype=float), fprime=equationPrime, full_output=True)
+    except RuntimeError:
+        converged = np.zeros(shape, dtype=bool)
+        root = np.full(shape, np.nan)
+
+    if not converged.all():
+        logger.warning("%s did not converge for %s in %d of %d cases", eqID, unknown, (~converged).sum(), converged.size)
+    if info is not None:
+        info.update(method="newton", nfev=nfev, converged=bool(converged.all()))
+
+    # Cases that did not converge are marked as NaN
+    return np.where(converged, root, np.nan)
+
+
+#---------------------------------------------
+# Block Step
+#---------------------------------------------
+def blockStep(eqIDs, unknowns, state, branch="supersonic", info=None, guesses=None):
+    """
+    Solves a coupled block of equations for its unknowns simultaneously
+
+    Newton iterates on the tear vars, scalars and arrays alike, with Mach
+    tear vars kept inside the selected branch. Cases the first guess does
+    not solve are retried from the further starts of branchRetry_dict, and
+    cases left with an unknown off the branch or out of bound_dict are NaN.
+    info and guesses are optional, as in equationStep.
+    """
+
+    tearVars, sequence, residualEqs = blockTearing(eqIDs, unknowns)
+    tearIndex = [symbolIndex_dict[var] for var in tearVars]
+
+    # Trial state shared by every iteration, tear and sequence slots are overwritten
+    trial = list(state)
+
+    # Iterates on the tear vars, the rest of the block follows in closed form
+    nfev = 0
+    def blockRunner(guess):
+        nonlocal nfev
+        nfev += 1
+        for i, value in zip(tearIndex, guess):
+            trial[i] = value
+        for eqID, var in sequence:
+            trial[symbolIndex_dict[var]] = equationStep(eqID, var, trial, branch)
+        return [equationResidual(eqID, trial) for eqID in residualEqs]
+
+    # Mach tear vars start on the selected branch, retries only move the Mach starts
+    guess = [
+        initialGuess(var, guesses, defaultGuess(var, branch))
+        for var in tearVars
+    ]
+    isMach = [registry.generic.get(var) == "Ma" for var in tearVars]
+    starts = [guess] + [
+        [start if mach else g for g, mach in zip(guess, isMach)]
+        for start in (branchRetry_dict[branch] if any(isMach) else ())
+    ]
+    bounds = [varBounds(var, branch) for var in tearVars]
+    shape = np.broadcast(*(v for v in state if v is not None)).shape
+
+    # Chain rule through the closed-form sequence, forward from the tear vars
+    def blockPrime(guess):
+        for i, value in zip(tearIndex, guess):
+            trial[i] = value
+        tangents = {i: [float(i == t) for t in tearIndex] for i in tearIndex}
+
+        for eqID, var in sequence:
+            index = symbolIndex_dict[var]
+            trial[index] = equationStep(eqID, var, trial, branch)
+            partials = equationGradient(eqID, trial)
+            tangents[index] = [
+                -sum(partials[w] * tangents[w][j] for w in partials if w in tangents) / partials[index]
+                for j in range(len(tearVars))
+            ]
+
+        jacobian = np.zeros((len(residualEqs), len(tearVars)) + shape)
+        for i, eqID in enumerate(residualEqs):
+            partials = equationGradient(eqID, trial)
+            for w in partials:
+                if w in tangents:
+                    for j in range(len(tearVars)):
+                        jacobian[i, j] += partials[w] * tangents[w][j]
+        return jacobian
+
+    # Fills in the rest of the block from the tear vars, True where every unknown is in bounds
+    def settle(tearValues):
+        for i, value in zip(tearIndex, tearValues):
+            trial[i] = value
+        for eqID, var in sequence:
+            trial[symbolIndex_dict[var]] = equationStep(eqID, var, trial, branch)
+
+        valid = np.ones(shape, dtype=bool)
+        for var in unknowns:
+            lower, upper = varBounds(var, branch)
+            with np.errstate(invalid="ignore"):
+                value = np.asarray(trial[symbolIndex_dict[var]], dtype=float)
+                valid &= (value > lower) & (value < upper)
+        return valid
+
+    tearValues = np.full((len(tearVars),) + shape, np.nan)
+    solved = np.zeros(shape, dtype=bool)
+    for start in starts:
+        values = batchNewton(blockRunner, [np.array(np.broadcast_to(g, shape), dtype=float) for g in start], jacobian=blockPrime, bounds=bounds)
+        valid = settle(values)
+        tearValues = np.where(valid & ~solved, values, tearValues)
+        solved |= valid
+        if solved.all():
+            break
+
+    converged = bool(solved.all())
+    if not converged:
+        logger.warning("Block %s did not converge on the %s branch in some cases", ", ".join(eqIDs), branch)
+
+    if info is not None:
+        info.update(method="block", nfev=nfev, converged=converged)
+
+    settle(tearValues)
+
+    return tuple(trial[symbolIndex_dict[var]][()] for var in unknowns)
+
+
+#---------------------------------------------
+# Block Tearing
+#---------------------------------------------
+@lru_cache(maxsize=256)
+def blockTearing(eqIDs, unknowns):
+    """
+    Picks tear vars for a coupled block
+
+    Returns (tearVars, sequence, residualEqs) for the smallest set of tear
+    vars from which the other unknowns follow one at a time through
+    closed-form inverses or bracketed roots. Tear vars with initial guesses
+    are preferred.
+    Falls back to iterating on every unknown.
+    """
+
+    unknownMask = registry.mask(unknowns)
+
+    for size in range(1, len(unknowns)):
+        candidates = sorted(combinations(unknowns, size), key=lambda tear: not all(var in guess_dict for var in tear))
+
+        for tearVars in candidates:
+            known = registry.mask(tearVars)
+            remaining = list(eqIDs)
+            sequence = []
+
+            running = True
+            while running:
+                running = False
+                for eqID in list(remaining):
+                    eqMask_unknown = registry.eqMask[eqID] & unknownMask & ~known
+                    if not singleBit(eqMask_unknown):
+                        continue
+
+                    var = registry.symbols[eqMask_unknown.bit_length() - 1]
+                    key = (registry.bindings[eqID].function.__name__, registry.argName(eqID, var))
+                    if key not in inverse_dict and key not in bracket_dict:
+                        continue
+
+                    sequence.append((eqID, var))
+                    known |= eqMask_unknown
+                    remaining.remove(eqID)
+                    running = True
+
+            if known & unknownMask == unknownMask and len(remaining) == size:
+                return tearVars, tuple(sequence), tuple(remaining)
+
+    return unknowns, (), eqIDs
+
+
+#---------------------------------------------
+# Equation Residual
+#---------------------------------------------
+def equationResidual(eqID, state):
+    """Evaluates an equation's residual from the state vector"""
+
+    binding = binding_dict[eqID]
+
+    return binding.function(*[state[i] for i in binding.argIndex])
+
+
+#---------------------------------------------
+# Equation Gradient
+#---------------------------------------------
+def equationGradient(eqID, state):
+    """Evaluates an equation's residual partials, keyed by symbol index"""
+
+    binding = binding_dict[eqID]
+    partials = binding.gradient(*[state[i] for i in binding.argIndex])
+
+    return {i: partials[name] for name, i in zip(binding.argNames, binding.argIndex)}
+
+
+#---------------------------------------------
+# Batch Newton
+#---------------------------------------------
+def batchNewton(function, guess, jacobian=None, tol=1e-10, maxiter=50, bounds=None):
+    """
+    Newton's method for many small systems at once
+
+    guess is a list of k arrays holding one unknown each across all cases,
+    and function returns the k residual arrays. jacobian returns the k x k
+    partials per case, taken by forward differences when not given, and
+    every case's system is solved in one call. bounds optionally holds an
+    open (lower, upper) interval per unknown, a step leaving it goes halfway
+    to the crossed bound instead, as in the bracketed roots. Cases that do
+    not converge are marked as NaN.
+    """
+
+    x = np.array(guess, dtype=float)
+    k = len(x)
+    converged = np.zeros(x.shape[1:], dtype=bool)
+
+    if bounds is not None:
+        lower, upper = (np.reshape([b[i] for b in bounds], (k,) + (1,) * (x.ndim - 1)) for i in (0, 1))
+
+    for _ in range(maxiter):
+        residual = np.array(function(x), dtype=float)
+
+        if jacobian is not None:
+            J = np.asarray(jacobian(x), dtype=float)
+        else:
+            J = np.empty((k,) + x.shape)
+            for j in range(k):
+                h = 1e-7 * np.maximum(np.abs(x[j]), 1.0)
+                xStep = x.copy()
+                xStep[j] += h
+                J[:, j] = (np.array(function(xStep), dtype=float) - residual) / h
+
+        if k == 1:
+            # Single tear var, no linear solve needed
+            with np.errstate(all="ignore"):
+                dx = -residual / J[0]
+        else:
+            # Move case axes first to solve every k x k system at once
+            J = np.moveaxis(J, (0, 1), (-2, -1))
+            r = np.moveaxis(residual, 0, -1)[..., None]
+            with np.errstate(all="ignore"):
+                try:
+                    dx = np.linalg.solve(J, -r)[..., 0]
+                except np.linalg.LinAlgError:
+                    dx = (np.linalg.pinv(J) @ -r)[..., 0]
+            dx = np.moveaxis(dx, -1, 0)
+
+        step = x + dx
+        inside = True
+        if bounds is not None:
+            below = step <= lower
+            above = step >= upper
+            with np.errstate(invalid="ignore"):
+                step = np.where(below, (x + lower) / 2, np.where(above, (x + upper) / 2, step))
+            inside = ~np.any(below | above, axis=0)
+        x = step
+
+        # A step cut at a bound is never taken as converged
+        converged = inside & np.all(np.abs(dx) <= tol * np.maximum(np.abs(x), 1.0), axis=0)
+        if converged.all():
+            break
+
+    return np.where(converged, x, np.nan)
+
+
 #---------------------------------------------
 # Constraint Checker
 #---------------------------------------------
@@ -145,52 +800,209 @@ def constraintChecker(inputVars:dict):
     if not isinstance(inputVars, dict):
         raise TypeError("inputVars must be a dict")
 
+    knownVars = {
+        **{k:v for k,v in inputVars.items()},
+        **{k:v for k,v in constantVars.items()},
+    }
+
     # Initialize dicts
     derivedVars = {}
 
-    running = True
-    iteration = 0
-    maxIteration = 100
-
-    while iteration < maxIteration and running:
-        running = False
-        iteration += 1
-
-        for eqID, eqVars in eqVars_dict.items():
-            knownVars = {
-                **{k:v for k,v in inputVars.items()},
-                **{k:v for k,v in derivedVars.items()},
-                **{k:v for k,v in constantVars.items()},
-            }
+    for eqIDs, unknowns in solvePlan(frozenset(knownVars)):
+        for unknown in unknowns:
+            derivedVars[unknown] = None
 
-            unknownVars = eqVars - knownVars.keys()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Constraint checker solved %s", ", ".join(eqIDs))
 
-            if len(unknownVars) == 1:
-                unknown = list(unknownVars)[0]
-
-                derivedVars[unknown] = None
+    return derivedVars
 
-                running = True
 
-                # Debug print
-                print(f"[Constraint Checker] solved eqID: {eqID}")
 
-    return derivedVars
+#---------------------------------------------
+# Incremental Constraint Propagator
+#---------------------------------------------
+class ConstraintPropagator:
+    """
+    Incrementally tracks which vars are derived from a set of inputs
+
+    Keeps a count of unknown vars per equation. Toggling a symbol only
+    updates the equations that contain it, and a worklist re-derives or
+    retracts vars from there. Coupled blocks are only searched for among
+    the equations touched by the toggle. Gives the same derived vars as
+    constraintChecker.
+    """
+
+    def __init__(self):
+        self.inputs = set()
+
+        # Registry bitmask of known or derived vars
+        self.known = registry.constantMask
+
+        # eqID : number of vars not yet known or derived
+        self.unknownCount = {eqID: registry.unknownCount(eqID, self.known) for eqID in registry.equations}
+
+        # derived var : (eqIDs, unknowns, consumed vars) of the step that derived it
+        self.derivation = {}
+
+        # var : derived vars whose derivation consumed it
+        self.dependents = {}
+
+        self.touched = set()
+        self.propagate(set(self.unknownCount))
+
+    #---------------------------------------------
+    # Public interface
+    #---------------------------------------------
+    def update(self, inputSymbols):
+        """Moves to a new set of input symbols and returns the derived vars"""
+        inputSymbols = set(inputSymbols)
+
+        for symbol in self.inputs - inputSymbols:
+            self.toggle(symbol, False)
+        for symbol in inputSymbols - self.inputs:
+            self.toggle(symbol, True)
+
+        return self.derivedVars()
+
+    def toggle(self, symbol, checked):
+        """Adds or removes a single input symbol"""
+        if checked == (symbol in self.inputs):
+            return
+
+        self.touched = set()
+
+        if checked:
+            # An input overrides a derivation of the same var
+            if symbol in self.derivation:
+                self.retract(symbol)
+
+            self.inputs.add(symbol)
+            if not self.known & registry.mask((symbol,)):
+                self.markKnown(symbol)
+        else:
+            self.inputs.discard(symbol)
+            if symbol not in constantVars:
+                self.retractDependents(symbol)
+                self.markUnknown(symbol)
+
+        self.propagate(self.touched)
+
+    def derivedVars(self):
+        """Derived vars in the same form constraintChecker returns"""
+        return {var: None for var in self.derivation}
+
+    #---------------------------------------------
+    # Propagation
+    #---------------------------------------------
+    def propagate(self, eqIDs):
+        """Derives vars from the given equations until nothing changes"""
+        worklist = [eqID for eqID in eqIDs if self.unknownCount[eqID] == 1]
+
+        while True:
+            while worklist:
+                eqID = worklist.pop()
+                if self.unknownCount[eqID] != 1:
+                    continue
 
+                unknown = registry.symbolsOf(registry.unknownMask(eqID, self.known))[0]
+                worklist.extend(self.derive((eqID,), (unknown,)))
+
+            # Worklist empty, look for coupled blocks near the toggle
+            for eqIDs, unknowns in coupledBlocks(self.known, self.neighborhood()):
+                worklist.extend(self.derive(eqIDs, unknowns))
+
+            if not worklist:
+                break
+
+    def neighborhood(self):
+        """Equations with two or more unknowns connected to the touched equations"""
+        pending = [eqID for eqID in self.touched if self.unknownCount[eqID] >= 2]
+        found = set(pending)
+
+        while pending:
+            eqID = pending.pop()
+            for var in registry.symbolsOf(registry.unknownMask(eqID, self.known)):
+                for other in registry.symbolEqs[var]:
+                    if other not in found and self.unknownCount[other] >= 2:
+                        found.add(other)
+                        pending.append(other)
+
+        return found
+
+    def derive(self, eqIDs, unknowns):
+        """Records a derivation and returns equations that now have one unknown"""
+        eqMask = 0
+        for eqID in eqIDs:
+            eqMask |= registry.eqMask[eqID]
+        consumed = set(registry.symbolsOf(eqMask & ~registry.mask(unknowns)))
+        step = (eqIDs, unknowns, consumed)
+
+        for var in consumed:
+            self.dependents.setdefault(var, set()).update(unknowns)
+
+        ready = []
+        for var in unknowns:
+            self.derivation[var] = step
+            ready.extend(self.markKnown(var))
+        return ready
+
+    #---------------------------------------------
+    # Retraction
+    #---------------------------------------------
+    def retract(self, var):
+        """Forgets a derived var, the rest of its step and everything derived from them"""
+        eqIDs, unknowns, consumed = self.derivation[var]
+
+        for unknown in unknowns:
+            if self.derivation.get(unknown) is None:
+                continue
+            del self.derivation[unknown]
+            self.retractDependents(unknown)
+            self.markUnknown(unknown)
+
+        for other in consumed:
+            self.dependents.get(other, set()).difference_update(unknowns)
+
+    def retractDependents(self, var):
+        """Retracts every derived var that consumed var"""
+        for dependent in list(self.dependents.pop(var, ())):
+            if dependent in self.derivation:
+                self.retract(dependent)
+
+    #---------------------------------------------
+    # Unknown counts
+    #---------------------------------------------
+    def markKnown(self, var):
+        """Marks var known and returns equations that now have one unknown"""
+        self.known |= registry.mask((var,))
+
+        ready = []
+        for eqID in registry.symbolEqs.get(var, ()):
+            self.unknownCount[eqID] -= 1
+            self.touched.add(eqID)
+            if self.unknownCount[eqID] == 1:
+                ready.append(eqID)
+        return ready
+
+    def markUnknown(self, var):
+        """Marks var unknown again"""
+        self.known &= ~registry.mask((var,))
+
+        for eqID in registry.symbolEqs.get(var, ()):
+            self.unknownCount[eqID] += 1
+            self.touched.add(eqID)
 
 
 #---------------------------------------------
-# Variable Normalizer
+# Compiled Equations
 #---------------------------------------------
-def varNormalizer(eqID, usedVars):
-    """Normalizes variable names"""
+# Symbol indices and bitmasks, equation masks, aliases and bound functions
+registry = Registry(eqVars_dict, varAlias_dict, eqID_normalize, constantVars)
+
+# Every symbol gets a fixed slot in the solver's state vector
+symbol_list = list(registry.symbols)
+symbolIndex_dict = registry.index
 
-    if eqID in eqID_normalize:
-        replacements = {}
-        for generic, aliases in varAlias_dict.items():
-            for alt in aliases:
-                if alt in usedVars:
-                    replacements[alt] = generic
-        for alt, generic in replacements.items():
-            usedVars[generic] = usedVars.pop(alt)
-    return usedVars
\ No newline at end of file
+# eqID : EquationBinding
+binding_dict = registry.bindings
@@ -0,0 +1,168 @@
+import numpy as np
+
+from .solver import equationSolver, asValue, SolveStats
+
+
+#---------------------------------------------
+# Sweep Solver
+#---------------------------------------------
+def sweepSolver(inputVars:dict, chunkSize=65536, progress=None, branch="supersonic", cancelEvent=None, mixture=None,
+                continuation=False, stride=64):
+    """
+    Solves a 1-D sweep chunk by chunk
+
+    Array inputs are swept together and must share one length, scalar inputs
+    hold for every point. After each chunk, progress(start, derivedVars) is
+    called with the chunk's results so callers can show partial sweeps.
+    Returns the derived vars of the whole sweep, like equationSolver, with
+    mixture passed on to it.
+    With continuation, the sweep is taken as ordered and each chunk is
+    solved by continuationSolver with the given stride, seeded from the
+    last case of the chunk before.
+    """
+
+    # Raises TypeError if inputVars is not a dict
+    if not isinstance(inputVars, dict):
+        raise TypeError("inputVars must be a dict")
+
+    inputVars = {k: asValue(v) for k, v in inputVars.items() if v is not None}
+    shape = np.broadcast(*inputVars.values()).shape if inputVars else ()
+
+    if shape == ():
+        derivedVars = equationSolver(inputVars, branch=branch, cancelEvent=cancelEvent, mixture=mixture)
+        if progress is not None:
+            progress(0, derivedVars)
+        return derivedVars
+
+    # Raises ValueError if the sweep is not 1-D
+    if len(shape) != 1:
+        raise ValueError("Sweep inputs must be 1-D")
+
+    n = shape[0]
+    derivedVars = {}
+    seed = None
+
+    for start in range(0, n, chunkSize):
+        stop = min(start + chunkSize, n)
+        chunk = {k: v[start:stop] if np.ndim(v) else v for k, v in inputVars.items()}
+
+        if continuation:
+            results = continuationSolver(chunk, stride, branch=branch, cancelEvent=cancelEvent, mixture=mixture, seed=seed)
+            seed = {k: v[-1] for k, v in results.items()}
+        else:
+            results = equationSolver(chunk, branch=branch, cancelEvent=cancelEvent, mixture=mixture)
+        for k, v in results.items():
+            derivedVars.setdefault(k, np.full(n, np.nan))[start:stop] = v
+
+        if progress is not None:
+            progress(start, results)
+
+    return derivedVars
+
+
+#---------------------------------------------
+# Continuation Solver
+#---------------------------------------------
+def continuationSolver(inputVars:dict, stride=16, branch="supersonic", cancelEvent=None, mixture=None,
+                       seed=None, info=None):
+    """
+    Solves an ordered 1-D sweep by continuation
+
+    The sweep is solved in vectorized passes over ever finer levels of
+    cases, every stride ** L-th case and the last, then every
+    stride ** (L - 1)-th and so on down to the rest. The coarsest level,
+    at most stride cases, starts from the default guesses, and every finer
+    level from its neighbours' solutions interpolated along the sweep, so
+    implicit unknowns need only a few Newton steps and stay on their
+    neighbours' root. A plan with no iterative steps ignores guesses and is
+    solved in one plain pass after the coarsest level. Cases a seeded pass
+    leaves unsolved are solved again from the default guesses.
+
+    seed optionally holds the solution just before the first case. info is
+    an optional dict, filled in with the vectorized passes, their residual
+    evaluations (nfev), those evaluations summed over the cases of each
+    pass (caseEvals) and the cases left unconverged.
+    """
+
+    inputVars = {k: asValue(v) for k, v in inputVars.items() if v is not None}
+    shape = np.broadcast(*inputVars.values()).shape if inputVars else ()
+
+    # Raises ValueError if the sweep is not 1-D
+    if len(shape) != 1:
+        raise ValueError("Continuation inputs must be a 1-D sweep")
+
+    n = shape[0]
+    index = np.arange(n)
+    stride = max(2, stride)
+    counts = {"passes": 0, "nfev": 0, "caseEvals": 0, "failed": 0}
+
+    derivedVars = {}
+    solved = np.zeros(n, dtype=bool)
+
+    def solveCases(cases, guesses=None):
+        """Vectorized solve of the given cases, stores them and returns the solve's stats"""
+        stats = SolveStats()
+        chunk = {k: v[cases] if np.ndim(v) else v for k, v in inputVars.items()}
+        results = equationSolver(chunk, branch=branch, cancelEvent=cancelEvent, mixture=mixture,
+                                 stats=stats, guesses=guesses)
+
+        counts["passes"] += 1
+        counts["nfev"] += stats.nfev
+        counts["caseEvals"] += stats.nfev * cases.size
+
+        for k, v in results.items():
+            derivedVars.setdefault(k, np.full(n, np.nan))[cases] = v
+        solved[cases] = True
+        return stats
+
+    def neighbourGuesses(cases):
+        """Guesses at the cases interpolated from the solved cases, and the seed before the first"""
+        guesses = {}
+        for k, v in derivedVars.items():
+            finite = solved & np.isfinite(v)
+            positions, values = index[finite], v[finite]
+            if seed is not None and np.isfinite(seed.get(k, np.nan)):
+                positions, values = np.r_[-1, positions], np.r_[seed[k], values]
+            if positions.size:
+                guesses[k] = np.interp(cases, positions, values)
+        return guesses
+
+    def unsolved(cases):
+        """Cases with any non-finite result"""
+        failed = np.zeros(cases.size, dtype=bool)
+        for v in derivedVars.values():
+            failed |= ~np.isfinite(v[cases])
+        return cases[failed]
+
+    # Coarsest level, at most stride cases and the last
+    step = 1
+    while n > step * stride:
+        step *= stride
+    coarse = np.union1d(index[::step], [n - 1])
+    stats = solveCases(coarse)
+
+    iterative = any(s["method"] in ("fsolve", "newton", "block") for s in stats.steps)
+    if not iterative:
+        rest = index[~solved]
+        if rest.size:
+            solveCases(rest)
+    else:
+        # Finer levels, seeded from the levels above
+        while step > 1:
+            step //= stride
+            cases = index[~solved & (index % step == 0)]
+            if not cases.size:
+                continue
+
+            solveCases(cases, neighbourGuesses(cases))
+
+            # Cases the neighbours led astray start again from the defaults
+            failed = unsolved(cases)
+            if failed.size:
+                solveCases(failed)
+
+    counts["failed"] = int(unsolved(index).size)
+    if info is not None:
+        info.update(counts)
+
+    return derivedVars
@@ -0,0 +1,46 @@
+import numpy
+
+from .solver import equationSolver, asValue
+from .atmosphere import ambientPressure, g_0
+
+
+# Nozzle state reused across altitudes
+nozzleVars = ("A_e", "mdot", "P_e", "v_e")
+
+
+#---------------------------------------------
+# Trajectory Profile
+#---------------------------------------------
+def trajectoryProfile(inputVars:dict, altitude, branch="supersonic", mixture=None):
+    """
+    Thrust and specific impulse of one design over altitudes
+
+    The design is solved once from inputVars, P_a and F included when they
+    size it, and only its nozzle state A_e, mdot, P_e and v_e is kept, since
+    ambient pressure does not reach the nozzle flow. P_a is then looked up
+    from the standard atmosphere at every geometric altitude [m] and F and
+    Isp are evaluated for all altitudes in one vectorized pass.
+
+    Returns altitude, P_a, F and Isp, NaN below the atmosphere table.
+    """
+
+    derivedVars = equationSolver(inputVars, branch=branch, mixture=mixture)
+    state = {**{k: asValue(v) for k, v in inputVars.items() if v is not None}, **derivedVars}
+
+    # Raises ValueError if the design does not fix the nozzle state
+    missing = [k for k in nozzleVars if k not in state]
+    if missing:
+        raise ValueError(f"Inputs do not determine {missing}, needed for thrust over altitude")
+
+    altitude = numpy.asarray(altitude, dtype=float)
+    P_a = ambientPressure(altitude)
+
+    A_e, mdot, P_e, v_e = (state[k] for k in nozzleVars)
+    F = mdot * v_e + (P_e - P_a) * A_e
+
+    return {
+        "altitude"  :   altitude,
+        "P_a"       :   P_a,
+        "F"         :   F,
+        "Isp"       :   F / (mdot * g_0),
+    }
@@ -0,0 +1,279 @@
+import zlib
+
+import numpy as np
+
+from .solver import equationSolver, asValue, SolveCancelled
+from .gases import mixtureInputs
+
+
+# Distribution name : sampler taking the generator, the sample count and the distribution's parameters
+distribution_dict = {
+    "normal"        :   lambda rng, n, mean, std: rng.normal(mean, std, n),                     # (mean, standard deviation)
+    "uniform"       :   lambda rng, n, low, high: rng.uniform(low, high, n),                    # (lower, upper)
+    "triangular"    :   lambda rng, n, low, mode, high: rng.triangular(low, mode, high, n),     # (lower, mode, upper)
+    "lognormal"     :   lambda rng, n, mean, sigma: rng.lognormal(mean, sigma, n),              # (mean, sigma) of the underlying normal
+}
+
+
+#---------------------------------------------
+# Running Moments
+#---------------------------------------------
+class RunningStats:
+    """
+    Count, mean, variance, min and max over a stream of chunks
+
+    Each chunk's moments are merged into the running ones with Chan's
+    parallel update, so the whole stream is never held.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.M2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        """Merges a chunk of finite values"""
+        n = values.size
+        if n == 0:
+            return
+
+        chunkMean = values.mean()
+        chunkM2 = ((values - chunkMean) ** 2).sum()
+
+        total = self.count + n
+        delta = chunkMean - self.mean
+
+        self.mean += delta * n / total
+        self.M2 += chunkM2 + delta ** 2 * self.count * n / total
+        self.count = total
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+    @property
+    def variance(self):
+        """Sample variance, NaN below two values"""
+        return self.M2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self):
+        """Sample standard deviation"""
+        return np.sqrt(self.variance)
+
+
+#---------------------------------------------
+# Quantile Sketch
+#---------------------------------------------
+class QuantileSketch:
+    """
+    Streaming quantile estimates in bounded memory
+
+    A compactor sketch: values land in level 0, and any level holding more
+    than k values is sorted and every other value, from a random offset, is
+    promoted to the next level, where each value stands for twice as many.
+    Memory stays around k values per level, with rank errors of order
+    log2(n / k) / k.
+    """
+
+    def __init__(self, k=4096, rng=None):
+        self.k = k
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.levels = [np.empty(0)]
+        self.count = 0
+
+    def update(self, values):
+        """Adds a chunk of finite values"""
+        self.levels[0] = np.concatenate((self.levels[0], values))
+        self.count += values.size
+        self.compress()
+
+    def compress(self):
+        """Compacts every level holding more than k values"""
+        h = 0
+        while h < len(self.levels):
+            level = self.levels[h]
+            if level.size > self.k:
+                level = np.sort(level)
+
+                # An odd value out stays behind
+                keep = level[-1:] if level.size % 2 else level[:0]
+                level = level[:level.size - keep.size]
+
+                if h + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[h + 1] = np.concatenate((self.levels[h + 1], level[self.rng.integers(2)::2]))
+                self.levels[h] = keep
+            h += 1
+
+    def quantile(self, q):
+        """Estimated q-quantiles, q a scalar or array in [0, 1]"""
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan)[()]
+
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(level.size, 2.0 ** h) for h, level in enumerate(self.levels)])
+
+        order = np.argsort(values)
+        values = values[order]
+        cumulative = np.cumsum(weights[order])
+
+        rank = np.asarray(q, dtype=float) * cumulative[-1]
+        return values[np.minimum(np.searchsorted(cumulative, rank), values.size - 1)]
+
+
+#---------------------------------------------
+# Streaming Histogram
+#---------------------------------------------
+class StreamingHistogram:
+    """
+    Fixed-bin histogram over a stream of chunks
+
+    Bin edges are given, or spread over the first chunk's range widened by
+    a quarter on each side. Values outside the edges are counted as
+    underflow and overflow.
+    """
+
+    def __init__(self, bins=100, edges=None):
+        self.bins = bins
+        self.edges = None if edges is None else np.asarray(edges, dtype=float)
+        self.counts = None if edges is None else np.zeros(len(edges) - 1, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+    def update(self, values):
+        """Bins a chunk of finite values"""
+        if values.size == 0:
+            return
+
+        if self.edges is None:
+            low, high = values.min(), values.max()
+            margin = 0.25 * (high - low) or 0.5 * (abs(low) or 1.0)
+            self.edges = np.linspace(low - margin, high + margin, self.bins + 1)
+            self.counts = np.zeros(self.bins, dtype=np.int64)
+
+        self.counts += np.histogram(values, self.edges)[0]
+        self.underflow += int((values < self.edges[0]).sum())
+        self.overflow += int((values > self.edges[-1]).sum())
+
+
+#---------------------------------------------
+# Streaming Stats
+#---------------------------------------------
+class StreamingStats:
+    """Moments, quantile sketch and histogram of one var, plus its failed samples"""
+
+    def __init__(self, bins=100, k=4096, rng=None):
+        self.moments = RunningStats()
+        self.sketch = QuantileSketch(k, rng)
+        self.histogram = StreamingHistogram(bins)
+        self.failed = 0
+
+    def update(self, values):
+        """Adds a chunk of samples, non-finite ones count as failed"""
+        values = np.ravel(values)
+        finite = np.isfinite(values)
+        self.failed += int(values.size - finite.sum())
+
+        values = values[finite]
+        self.moments.update(values)
+        self.sketch.update(values)
+        self.histogram.update(values)
+
+    def summary(self, quantiles=(0.05, 0.5, 0.95)):
+        """Dict of count, failed, mean, std, min, max and the requested quantiles"""
+        return {
+            "count"     :   self.moments.count,
+            "failed"    :   self.failed,
+            "mean"      :   self.moments.mean if self.moments.count else np.nan,
+            "std"       :   self.moments.std,
+            "min"       :   self.moments.min if self.moments.count else np.nan,
+            "max"       :   self.moments.max if self.moments.count else np.nan,
+            "quantiles" :   dict(zip(quantiles, np.atleast_1d(self.sketch.quantile(quantiles)))),
+        }
+
+
+#---------------------------------------------
+# Sampling
+#---------------------------------------------
+def drawSamples(inputVars:dict, n, rng):
+    """
+    Draws n samples of every input
+
+    Inputs are fixed values or (distribution, *parameters) tuples naming a
+    distribution_dict entry, e.g. ("normal", 3e6, 5e4).
+    """
+    samples = {}
+    for var, spec in inputVars.items():
+        if spec is None:
+            continue
+        if isinstance(spec, tuple):
+            name, *params = spec
+
+            # Raises ValueError for unknown distributions
+            if name not in distribution_dict:
+                raise ValueError(f"Unknown distribution {name!r} for {var}, expected one of {sorted(distribution_dict)}")
+
+            samples[var] = distribution_dict[name](rng, n, *params)
+        else:
+            samples[var] = asValue(spec)
+    return samples
+
+
+#---------------------------------------------
+# Monte Carlo
+#---------------------------------------------
+def monteCarlo(inputVars:dict, samples=1_000_000, outputs=("F", "mdot", "v_e"), chunkSize=65536, seed=None,
+               bins=100, branch="supersonic", mixture=None, pool=None, progress=None, cancelEvent=None):
+    """
+    Propagates input distributions through the equations by Monte Carlo
+
+    inputVars holds fixed values and (distribution, *parameters) tuples,
+    see drawSamples. Samples are drawn and solved chunkSize at a time in one
+    vectorized pass, across pool when one is given, on branch either way,
+    and only streaming statistics of the outputs are kept. outputs may name inputs as well as
+    derived vars. After each chunk, progress(done, stats) is called.
+
+    Returns a dict of output : StreamingStats.
+    """
+    seedSequence = np.random.SeedSequence(seed)
+    rng = np.random.default_rng(seedSequence)
+
+    # Each sketch draws from its own stream keyed by its output's name, so
+    # neither the samples nor another output's statistics depend on outputs
+    stats = {
+        var: StreamingStats(bins, rng=np.random.default_rng(
+            np.random.SeedSequence(seedSequence.entropy, spawn_key=(zlib.crc32(var.encode()),))
+        ))
+        for var in outputs
+    }
+
+    for start in range(0, samples, chunkSize):
+        if cancelEvent is not None and cancelEvent.is_set():
+            raise SolveCancelled()
+
+        n = min(chunkSize, samples - start)
+        chunk = drawSamples(inputVars, n, rng)
+
+        if mixture is not None:
+            chunk = mixtureInputs(chunk, mixture)
+
+        if pool is not None:
+            derivedVars = pool.solve(chunk, branch=branch)
+        else:
+            derivedVars = equationSolver(chunk, branch=branch, cancelEvent=cancelEvent)
+
+        solvedVars = {**chunk, **derivedVars}
+
+        # Raises ValueError if an output is not determined by the inputs
+        missing = [var for var in outputs if var not in solvedVars]
+        if missing:
+            raise ValueError(f"Inputs do not determine {missing}")
+
+        for var in outputs:
+            stats[var].update(np.broadcast_to(solvedVars[var], (n,)))
+
+        if progress is not None:
+            progress(start + n, stats)
+
+    return stats
@@ -1 +1,141 @@
-#Converts Units
\ No newline at end of file
+#Converts Units
+import re
+
+import numpy
+
+
+__all__ = ["unit_dict", "symbolDimension_dict", "toSI", "fromSI", "parseColumn"]
+
+
+# Unit : (dimension, factor, offset), SI = value * factor + offset
+unit_dict = {
+    # Pressure                                                      [Pa]
+    "Pa"        :   ("pressure",        1.0,                0.0),
+    "kPa"       :   ("pressure",        1e3,                0.0),
+    "MPa"       :   ("pressure",        1e6,                0.0),
+    "bar"       :   ("pressure",        1e5,                0.0),
+    "psi"       :   ("pressure",        6894.757293168361,  0.0),
+    "atm"       :   ("pressure",        101325.0,           0.0),
+
+    # Temperature                                                   [K]
+    "K"         :   ("temperature",     1.0,                0.0),
+    "°K"        :   ("temperature",     1.0,                0.0),
+    "°C"        :   ("temperature",     1.0,                273.15),
+    "°F"        :   ("temperature",     5 / 9,              273.15 - 32 * 5 / 9),
+    "°R"        :   ("temperature",     5 / 9,              0.0),
+
+    # Area                                                          [m²]
+    "m²"        :   ("area",            1.0,                0.0),
+    "cm²"       :   ("area",            1e-4,               0.0),
+    "mm²"       :   ("area",            1e-6,               0.0),
+    "ft²"       :   ("area",            0.09290304,         0.0),
+    "in²"       :   ("area",            0.00064516,         0.0),
+
+    # Velocity                                                      [m/s]
+    "m/s"       :   ("velocity",        1.0,                0.0),
+    "km/s"      :   ("velocity",        1e3,                0.0),
+    "ft/s"      :   ("velocity",        0.3048,             0.0),
+
+    # Force                                                         [N]
+    "N"         :   ("force",           1.0,                0.0),
+    "kN"        :   ("force",           1e3,                0.0),
+    "lbf"       :   ("force",           4.4482216152605,    0.0),
+
+    # Mass flow                                                     [kg/s]
+    "kg/s"      :   ("massFlow",        1.0,                0.0),
+    "g/s"       :   ("massFlow",        1e-3,               0.0),
+    "lbs/s"     :   ("massFlow",        0.45359237,         0.0),
+    "lb/s"      :   ("massFlow",        0.45359237,         0.0),
+
+    # Molar mass                                                    [kg/mol]
+    "kg/mol"    :   ("molarMass",       1.0,                0.0),
+    "g/mol"     :   ("molarMass",       1e-3,               0.0),
+
+    # Specific gas constant                                         [J/(kg·K)]
+    "J/(kg·K)"  :   ("gasConstant",     1.0,                0.0),
+    "J/(kg*K)"  :   ("gasConstant",     1.0,                0.0),
+}
+
+# Symbol : dimension, symbols not listed are dimensionless
+symbolDimension_dict = {
+    "P_c"   :   "pressure",
+    "P_s"   :   "pressure",
+    "P_t"   :   "pressure",
+    "P_e"   :   "pressure",
+    "P_a"   :   "pressure",
+    "T_c"   :   "temperature",
+    "T_s"   :   "temperature",
+    "T_t"   :   "temperature",
+    "T_e"   :   "temperature",
+    "A_t"   :   "area",
+    "A_e"   :   "area",
+    "v_e"   :   "velocity",
+    "F"     :   "force",
+    "mdot"  :   "massFlow",
+    "M"     :   "molarMass",
+    "R"     :   "gasConstant",
+}
+
+
+#---------------------------------------------
+# Unit Lookup
+#---------------------------------------------
+def unitFactors(unit, symbol=None):
+    """
+    Returns the (factor, offset) of a unit
+
+    Raises ValueError for unknown units, and for units that do not match the
+    dimension of symbol when one is given.
+    """
+    if unit not in unit_dict:
+        raise ValueError(f"Unknown unit {unit!r}")
+
+    dimension, factor, offset = unit_dict[unit]
+
+    if symbol is not None and symbolDimension_dict.get(symbol) != dimension:
+        raise ValueError(f"Unit {unit!r} is not a valid unit for {symbol!r}")
+
+    return factor, offset
+
+
+#---------------------------------------------
+# Conversions
+#---------------------------------------------
+def toSI(value, unit, symbol=None):
+    """
+    Converts a value or a whole array of values from unit to SI
+
+    A unit of None or "" leaves the value untouched.
+    """
+    if not unit:
+        return value
+
+    factor, offset = unitFactors(unit, symbol)
+    return numpy.asarray(value, dtype=float) * factor + offset
+
+
+def fromSI(value, unit, symbol=None):
+    """
+    Converts a value or a whole array of values from SI to unit
+
+    A unit of None or "" leaves the value untouched.
+    """
+    if not unit:
+        return value
+
+    factor, offset = unitFactors(unit, symbol)
+    return (numpy.asarray(value, dtype=float) - offset) / factor
+
+
+#---------------------------------------------
+# Column Names
+#---------------------------------------------
+columnPattern = re.compile(r"^\s*(?P<symbol>[^\[\]]+?)\s*(?:\[(?P<unit>[^\[\]]*)\])?\s*$")
+
+def parseColumn(name):
+    """Splits a column name like 'P_c[psi]' into ('P_c', 'psi'), the unit being None when absent"""
+    match = columnPattern.match(name or "")
+    if match is None:
+        return name, None
+
+    return match["symbol"], (match["unit"] or "").strip() or None
@@ -1,18 +1,50 @@
 import sys
-from PyQt6.QtWidgets import QApplication
-from ui.main_window import MainWindow
-from core.controller import Controller
+import argparse
+import logging
 
 
-def main():
-    app = QApplication(sys.argv)
+def parseArgs(argv):
+    parser = argparse.ArgumentParser(description="Engine Initial Variables")
+    parser.add_argument("--batch", metavar="CSV", help="solve the cases in a CSV file ('-' for stdin) without the GUI")
+    parser.add_argument("-o", "--output", metavar="CSV", default="-", help="batch results file ('-' for stdout)")
+    parser.add_argument("--chunk-size", type=int, default=1024, help="cases read and solved together")
+    parser.add_argument("--branch", choices=["subsonic", "supersonic"], default="supersonic", help="Area-Mach branch")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes for batch solves")
+    parser.add_argument("--cache", metavar="FILE", help="SQLite file caching batch results across runs")
+    parser.add_argument("--mixture", help="gas property table filling empty gamma and M, air (250-1000 K) or hydrolox (300-3500 K)")
+    parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"], default="WARNING", help="logging level, logs go to stderr")
+
+    # Unknown args are left for Qt
+    return parser.parse_known_args(argv)
+
+
+def runGui(argv):
+    from PyQt6.QtWidgets import QApplication
+    from ui.main_window import MainWindow
+    from core.controller import Controller
+
+    app = QApplication(argv)
 
     window = MainWindow()
     controller = Controller(window)
     window.show()
 
-    sys.exit(app.exec())
+    return app.exec()
+
+
+def main():
+    args, qtArgs = parseArgs(sys.argv[1:])
+
+    logging.basicConfig(level=args.log_level, format="[%(name)s] %(levelname)s: %(message)s")
+
+    if args.batch is not None:
+        from core.batch import runBatch
+
+        runBatch(args.batch, args.output, args.chunk_size, args.branch, args.workers, args.cache, args.mixture)
+        sys.exit(0)
+
+    sys.exit(runGui(sys.argv[:1] + qtArgs))
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
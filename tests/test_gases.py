@@ -0,0 +1,70 @@
+import logging
+
+import numpy as np
+import pytest
+
+from core.gases import gasProperties, mixtureInputs, tableRange, mixture_dict
+from core.nozzle import nozzleProfile
+from core.solver import equationSolver
+
+
+#---------------------------------------------
+# Interpolation
+#---------------------------------------------
+def test_interpolates_between_rows():
+    # Air rows at 250 K and 300 K hold gamma 1.401 and 1.400
+    props = gasProperties("air", np.array([250.0, 275.0, 300.0]))
+
+    np.testing.assert_allclose(props["gamma"], [1.401, 1.4005, 1.400])
+    np.testing.assert_allclose(props["R"], 8.31446261815324 / 0.02897)
+
+
+@pytest.mark.parametrize("mixture", sorted(mixture_dict))
+def test_tables_are_sorted_and_physical(mixture):
+    low, high = tableRange(mixture)
+    T = np.linspace(low, high, 50)
+    props = gasProperties(mixture, T)
+
+    assert low < high
+    assert np.all((props["gamma"] > 1) & (props["gamma"] < 5 / 3))
+    assert np.all(props["M"] > 0)
+
+
+def test_chamber_temperatures_are_covered():
+    low, high = tableRange("hydrolox")
+    assert low <= 3000 and high >= 3500
+
+    derivedVars = equationSolver({"A_t": 0.01, "A_e": 0.1, "P_c": 3e6, "T_c": 3400, "P_a": 101325}, mixture="hydrolox")
+    assert derivedVars["Ma_e"] > 1
+    assert derivedVars["F"] > 0
+
+
+#---------------------------------------------
+# Out Of Range
+#---------------------------------------------
+def test_single_case_outside_table_raises():
+    with pytest.raises(ValueError, match="outside"):
+        mixtureInputs({"T_c": 3000.0}, "air")
+
+
+def test_array_cases_outside_table_warn_and_get_nan(caplog):
+    with caplog.at_level(logging.WARNING, logger="core.gases"):
+        inputVars = mixtureInputs({"T_c": np.array([500.0, 3000.0])}, "air")
+
+    assert "1 of 2 cases" in caplog.text
+    assert np.isfinite(inputVars["gamma"][0]) and np.isnan(inputVars["gamma"][1])
+
+
+def test_given_properties_skip_the_table():
+    inputVars = mixtureInputs({"T_c": 3000.0, "gamma": 1.2, "M": 0.022}, "air")
+    assert inputVars["gamma"] == 1.2
+
+
+def test_nozzle_profile_checks_the_table_range():
+    area = np.linspace(0.02, 0.1, 20)
+
+    with pytest.raises(ValueError, match="outside"):
+        nozzleProfile(area, 3e6, 3000.0, mixture="air")
+
+    profile = nozzleProfile(area, 3e6, 3000.0, mixture="hydrolox")
+    assert np.all(np.isfinite(profile["T"]))
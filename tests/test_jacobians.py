@@ -0,0 +1,60 @@
+import inspect
+
+import numpy as np
+import pytest
+
+import core.physics as physics
+from core.jacobians import jacobian_dict
+
+
+# Physically valid sampling range per arg, static states below stagnation
+range_dict = {
+    "M"         :   (0.01, 0.04),
+    "R"         :   (200.0, 600.0),
+    "gamma"     :   (1.1, 1.6),
+    "Ma"        :   (0.2, 3.0),
+    "Ma_t"      :   (0.2, 3.0),
+    "Ma_e"      :   (0.2, 3.0),
+    "T"         :   (300.0, 2000.0),
+    "T_s"       :   (2500.0, 3500.0),
+    "T_c"       :   (2500.0, 3500.0),
+    "P"         :   (1e4, 1e6),
+    "P_e"       :   (1e4, 1e6),
+    "P_a"       :   (1e4, 1e5),
+    "P_s"       :   (2e6, 1e7),
+    "P_c"       :   (2e6, 1e7),
+    "A_t"       :   (0.005, 0.02),
+    "A_e"       :   (0.02, 0.2),
+    "mdot"      :   (1.0, 50.0),
+    "v_e"       :   (1000.0, 3000.0),
+    "F"         :   (1e4, 1e6),
+}
+
+cases = 200
+step = 1e-6
+
+
+#---------------------------------------------
+# Central Differences
+#---------------------------------------------
+@pytest.mark.parametrize("name", sorted(jacobian_dict))
+def test_gradient_matches_central_differences(name):
+    function = getattr(physics, name)
+    argNames = list(inspect.signature(function).parameters)
+    rng = np.random.default_rng(sum(map(ord, name)))
+
+    args = {arg: rng.uniform(*range_dict[arg], cases) for arg in argNames}
+    partials = jacobian_dict[name](**args)
+
+    assert set(partials) == set(argNames)
+
+    # Sensitivities to a relative change, so every arg is compared on one scale
+    numeric = {}
+    for arg in argNames:
+        h = step * args[arg]
+        numeric[arg] = (function(**{**args, arg: args[arg] + h}) - function(**{**args, arg: args[arg] - h})) / 2
+    scale = np.max([np.abs(v) for v in numeric.values()], axis=0)
+
+    for arg in argNames:
+        analytic = partials[arg] * args[arg] * step
+        assert np.all(np.abs(analytic - numeric[arg]) <= 1e-5 * scale), arg
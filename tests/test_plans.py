@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+
+from core.solver import (
+    solvePlan,
+    equationSolver,
+    equationGradient,
+    eqVars_dict,
+    eqID_dependent,
+    constantVars,
+    registry,
+)
+
+
+constants = frozenset(k for k, v in constantVars.items() if v is not None)
+symbols = sorted(set(registry.symbols) - constants)
+
+knownSets = 3000
+
+# Blocks the structural matching cannot tell are singular, the eqs only fix
+# P_e / P_s, or R * T_s, or mdot * v_e, which does not depend on R * T_s
+degenerate_list = [
+    ({"pressureRatio@Exit", "exitVelocity"}, {"P_s", "P_e"}),
+    ({"exitVelocity", "massFlow"}, {"T_s", "R"}),
+    ({"exitVelocity", "massFlow", "thrust"}, {"v_e", "R", "mdot"}),
+    ({"exitVelocity", "massFlow", "thrust"}, {"v_e", "T_s", "mdot"}),
+]
+
+
+def randomKnownSets(seed):
+    """Random sets of known symbols, constants included"""
+    rng = np.random.default_rng(seed)
+    for _ in range(knownSets):
+        size = rng.integers(1, len(symbols))
+        yield frozenset(rng.choice(symbols, size, replace=False)) | constants
+
+
+def setPlan(knownSymbols):
+    """Reference one-unknown sweep on plain sets, stops where a block would be needed"""
+    known = set(knownSymbols)
+    plan = []
+
+    running = True
+    while running:
+        running = False
+        for eqID, eqVars in eqVars_dict.items():
+            unknowns = eqVars - known
+            if len(unknowns) == 1:
+                plan.append(((eqID,), tuple(unknowns)))
+                known |= unknowns
+                running = True
+
+    return plan
+
+
+#---------------------------------------------
+# Plan Structure
+#---------------------------------------------
+def test_plans_match_set_sweep():
+    for knownSymbols in randomKnownSets(18):
+        plan = list(solvePlan(knownSymbols))
+        reference = setPlan(knownSymbols)
+
+        # Identical up to the first coupled block
+        assert plan[:len(reference)] == reference, sorted(knownSymbols)
+        assert all(len(eqIDs) > 1 for eqIDs, _ in plan[len(reference):len(reference) + 1])
+
+
+def test_plan_steps_are_well_posed():
+    for knownSymbols in randomKnownSets(180):
+        known = set(knownSymbols)
+
+        for eqIDs, unknowns in solvePlan(knownSymbols):
+            blockVars = set().union(*(eqVars_dict[eqID] for eqID in eqIDs))
+
+            # Square, every var solved once and only the step's unknowns left open
+            assert len(eqIDs) == len(unknowns)
+            assert not known & set(unknowns)
+            assert blockVars - known == set(unknowns)
+
+            # An implied eq never sits in a block with a source, or once a source holds
+            for eqID, sources in eqID_dependent.items():
+                if eqID in eqIDs and len(eqIDs) > 1:
+                    assert not sources & set(eqIDs)
+                    assert not any(eqVars_dict[source] <= known for source in sources)
+
+            known |= set(unknowns)
+
+        # Nothing left that a single equation could still derive
+        assert all(len(eqVars - known) != 1 for eqVars in eqVars_dict.values())
+
+
+#---------------------------------------------
+# Block Jacobians
+#---------------------------------------------
+@pytest.fixture(scope="module")
+def solvedState():
+    inputVars = {"A_t": 0.01, "A_e": 0.1, "P_c": 3e6, "T_c": 3000, "gamma": 1.2, "M": 0.022, "P_a": 101325}
+    values = {**inputVars, **constantVars, **equationSolver(inputVars)}
+    return [float(values[symbol]) for symbol in registry.symbols]
+
+
+def test_block_jacobians_are_nonsingular(solvedState):
+    blocks = {
+        step
+        for knownSymbols in randomKnownSets(1800)
+        for step in solvePlan(knownSymbols)
+        if len(step[0]) > 1
+    }
+    assert blocks
+
+    for eqIDs, unknowns in blocks:
+        if (set(eqIDs), set(unknowns)) in degenerate_list:
+            continue
+
+        J = np.zeros((len(eqIDs), len(unknowns)))
+        for i, eqID in enumerate(eqIDs):
+            partials = equationGradient(eqID, solvedState)
+            for k, var in enumerate(unknowns):
+                J[i, k] = partials.get(registry.index[var], 0.0)
+
+        # Scaled so rows and columns of very different magnitude compare fairly
+        J /= np.abs(J).max(axis=1, keepdims=True)
+        J /= np.abs(J).max(axis=0, keepdims=True)
+        assert np.linalg.cond(J) < 1e8, eqIDs
@@ -0,0 +1,52 @@
+import numpy as np
+
+from core.solver import ConstraintPropagator, constraintChecker, registry
+
+
+# Symbols a user can check, constants included since they may be overridden
+symbols = sorted(registry.symbols)
+
+sequences = 300
+toggles = 25
+
+
+#---------------------------------------------
+# Random Toggle Sequences
+#---------------------------------------------
+def test_toggles_match_constraint_checker():
+    rng = np.random.default_rng(9)
+
+    for _ in range(sequences):
+        propagator = ConstraintPropagator()
+        inputs = set()
+
+        for symbol in rng.choice(symbols, toggles):
+            checked = symbol not in inputs
+            propagator.toggle(symbol, checked)
+            inputs.symmetric_difference_update({symbol})
+
+            expected = constraintChecker(dict.fromkeys(inputs))
+            assert set(propagator.derivedVars()) == set(expected), sorted(inputs)
+
+
+def test_update_matches_constraint_checker():
+    rng = np.random.default_rng(90)
+    propagator = ConstraintPropagator()
+
+    for _ in range(sequences):
+        inputs = set(rng.choice(symbols, rng.integers(0, len(symbols) + 1), replace=False))
+
+        expected = constraintChecker(dict.fromkeys(inputs))
+        assert set(propagator.update(inputs)) == set(expected), sorted(inputs)
+
+
+def test_unchecking_everything_restores_the_start():
+    start = ConstraintPropagator()
+    propagator = ConstraintPropagator()
+
+    propagator.update({"P_c", "T_c", "gamma", "M", "A_t", "F", "P_a"})
+    propagator.update(set())
+
+    assert propagator.derivedVars() == start.derivedVars()
+    assert propagator.known == start.known
+    assert propagator.unknownCount == start.unknownCount
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+import core.roots as roots
+from core.solver import equationSolver, defaultGuess
+
+
+# Reference design, A_e / A_t = 10
+reference_dict = {
+    "A_t"       :   0.01,
+    "A_e"       :   0.1,
+    "P_c"       :   3e6,
+    "T_c"       :   3000,
+    "gamma"     :   1.2,
+    "M"         :   0.022,
+    "P_a"       :   101325,
+}
+
+
+#---------------------------------------------
+# Reference Case
+#---------------------------------------------
+def test_reference_case():
+    derivedVars = equationSolver(reference_dict)
+
+    assert derivedVars["Ma_e"] == pytest.approx(3.27834, rel=1e-5)
+    assert derivedVars["F"] == pytest.approx(42136.7, rel=1e-5)
+
+
+def test_reference_case_batch_matches_scalar():
+    scalar = equationSolver(reference_dict)
+    batch = equationSolver({**reference_dict, "P_c": np.full(3, 3e6)})
+
+    for k, v in scalar.items():
+        np.testing.assert_allclose(batch[k], v, rtol=1e-9)
+
+
+def test_mach_guesses_avoid_sonic_point():
+    for var in ("Ma_e", "Ma_t"):
+        assert defaultGuess(var, "subsonic") < 1.0 < defaultGuess(var, "supersonic")
+
+
+def test_iterative_mach_starts_on_branch(monkeypatch):
+    # Without the bracketed root Ma_e falls back to fsolve, which stalls at the sonic point from 1.0
+    monkeypatch.delitem(roots.bracket_dict, ("areaMachRelation", "Ma_e"))
+
+    derivedVars = equationSolver(reference_dict)
+
+    assert derivedVars["Ma_e"] == pytest.approx(3.27834, rel=1e-5)
+    assert derivedVars["F"] == pytest.approx(42136.7, rel=1e-5)
+
+
+#---------------------------------------------
+# Underdetermined Inputs
+#---------------------------------------------
+def test_missing_pressure_is_not_derived():
+    derivedVars = equationSolver({k: v for k, v in reference_dict.items() if k != "P_c"})
+
+    for symbol in ("P_s", "P_c", "P_e", "mdot", "F"):
+        assert symbol not in derivedVars
+
+
+#---------------------------------------------
+# Thrust Given
+#---------------------------------------------
+@pytest.mark.parametrize("F", [33000.0, np.array([33000.0, 42136.7])])
+def test_thrust_block_stays_on_branch(F):
+    # Coupled exit block with Ma_e as tear var, Newton from Ma_e = 2 heads through the sonic point
+    inputVars = {k: v for k, v in reference_dict.items() if k != "A_e"}
+    derivedVars = equationSolver({**inputVars, "F": F})
+
+    assert np.all(derivedVars["Ma_e"] > 1)
+    assert np.all(derivedVars["A_e"] > inputVars["A_t"])
+    np.testing.assert_allclose(equationSolver({**inputVars, "A_e": derivedVars["A_e"]})["F"], F, rtol=1e-8)
+
+
+def test_thrust_block_scalar_matches_batch():
+    inputVars = {k: v for k, v in reference_dict.items() if k != "A_e"}
+
+    scalar = equationSolver({**inputVars, "F": 33000.0})
+    batch = equationSolver({**inputVars, "F": np.full(2, 33000.0)})
+
+    assert scalar["A_e"] == pytest.approx(0.2155, rel=1e-3)
+    np.testing.assert_allclose(batch["A_e"], scalar["A_e"], rtol=1e-9)
+
+
+def test_unreachable_thrust_is_nan():
+    # Above the largest thrust of any supersonic exit
+    inputVars = {k: v for k, v in reference_dict.items() if k != "A_e"}
+
+    assert np.isnan(equationSolver({**inputVars, "F": 60000.0})["A_e"])
@@ -0,0 +1,60 @@
+import numpy as np
+
+from core.solver import equationSolver, SolveStats
+from core.sweep import continuationSolver
+
+
+design_dict = {
+    "A_t"       :   0.01,
+    "P_c"       :   3e6,
+    "T_c"       :   3000,
+    "gamma"     :   1.2,
+    "M"         :   0.022,
+    "P_a"       :   101325,
+}
+
+cases = 2000
+
+
+#---------------------------------------------
+# Continuation
+#---------------------------------------------
+def test_continuation_needs_fewer_iterations():
+    # Every thrust solves the coupled exit block, off the default Mach start
+    inputVars = {**design_dict, "F": np.linspace(25000.0, 35000.0, cases)}
+
+    stats = SolveStats()
+    plain = equationSolver(inputVars, stats=stats)
+
+    info = {}
+    continued = continuationSolver(inputVars, info=info)
+
+    assert info["failed"] == 0
+    assert info["caseEvals"] < stats.nfev * cases / 5
+    np.testing.assert_allclose(continued["A_e"], plain["A_e"], rtol=1e-9)
+
+
+def test_closed_form_sweep_skips_the_levels():
+    inputVars = {**design_dict, "A_e": np.linspace(0.02, 0.3, cases)}
+
+    stats = SolveStats()
+    plain = equationSolver(inputVars, stats=stats)
+
+    info = {}
+    continued = continuationSolver(inputVars, info=info)
+
+    # Coarsest level, then everything else in one pass
+    assert info["passes"] == 2
+    assert info["caseEvals"] == stats.nfev * cases
+    np.testing.assert_allclose(continued["F"], plain["F"], rtol=1e-12)
+
+
+def test_seed_continues_from_the_chunk_before():
+    inputVars = {**design_dict, "F": np.linspace(25000.0, 35000.0, cases)}
+    whole = continuationSolver(inputVars)
+
+    half = cases // 2
+    second = {**design_dict, "F": inputVars["F"][half:]}
+    seeded = continuationSolver(second, seed={k: v[half - 1] for k, v in whole.items()})
+
+    np.testing.assert_allclose(seeded["A_e"], whole["A_e"][half:], rtol=1e-9)
@@ -0,0 +1,43 @@
+import pytest
+
+from core.parallel import SolverPool
+from core.uncertainty import monteCarlo
+
+
+design_dict = {
+    "A_t"       :   0.01,
+    "A_e"       :   0.1,
+    "P_c"       :   ("normal", 3e6, 1e5),
+    "T_c"       :   3000,
+    "gamma"     :   1.2,
+    "M"         :   0.022,
+    "P_a"       :   101325,
+}
+
+
+#---------------------------------------------
+# Pool Branch
+#---------------------------------------------
+@pytest.mark.parametrize("branch", ["subsonic", "supersonic"])
+def test_pool_solves_on_the_requested_branch(branch):
+    serial = monteCarlo(design_dict, samples=2000, outputs=("Ma_e",), seed=1, branch=branch)
+
+    # The pool's own branch is the other one
+    other = "supersonic" if branch == "subsonic" else "subsonic"
+    with SolverPool(2, other) as pool:
+        pooled = monteCarlo(design_dict, samples=2000, outputs=("Ma_e",), seed=1, branch=branch, pool=pool)
+
+    assert pooled["Ma_e"].moments.mean == pytest.approx(serial["Ma_e"].moments.mean, rel=1e-12)
+    assert (pooled["Ma_e"].moments.mean < 1) == (branch == "subsonic")
+
+
+#---------------------------------------------
+# Seeded Streams
+#---------------------------------------------
+def test_statistics_do_not_depend_on_outputs():
+    alone = monteCarlo(design_dict, samples=20000, outputs=("F",), chunkSize=4096, seed=3)["F"]
+    shared = monteCarlo(design_dict, samples=20000, outputs=("mdot", "F", "v_e"), chunkSize=4096, seed=3)["F"]
+
+    assert alone.moments.mean == shared.moments.mean
+    assert alone.moments.variance == shared.moments.variance
+    assert alone.summary() == shared.summary()
@@ -24,8 +24,14 @@ from PyQt6.QtCore import(
     pyqtSignal
 )
 import numpy as np
+import logging
 import sys
 
+from ui.sweep_plot import SweepPlot
+
+
+logger = logging.getLogger(__name__)
+
 
 #---------------------------------------------
 # Group vars information
@@ -142,18 +148,48 @@ class InputWidget(QWidget):
                 unit_dropdown.setFixedWidth(80)
                 self.layout.addWidget(unit_dropdown, self.row, 4)
 
+            # Range mode, the input becomes the start of a start/stop/steps sweep
+            range_button = QPushButton("Range")
+            range_button.setCheckable(True)
+            range_button.setFixedWidth(60)
+            range_button.setToolTip("Sweep this input from start to stop in a number of steps")
+            self.layout.addWidget(range_button, self.row, 5)
+
+            stop_field = QLineEdit()
+            stop_field.setPlaceholderText("stop")
+            stop_field.setFixedWidth(90)
+            self.layout.addWidget(stop_field, self.row, 6)
+
+            steps_field = QLineEdit()
+            steps_field.setPlaceholderText("steps")
+            steps_field.setFixedWidth(70)
+            self.layout.addWidget(steps_field, self.row, 7)
+
+            def handleRange(state, input_field=input_field, stop_field=stop_field, steps_field=steps_field):
+                input_field.setPlaceholderText("start" if state else "")
+                stop_field.setVisible(state)
+                steps_field.setVisible(state)
+
+            range_button.toggled.connect(handleRange)
+            handleRange(False)
+
             # Store state and value to dict
             self.fieldValues[name] = {
                 "symbol" : symbol,
                 "checkbox" : checkbox,
                 "input" : input_field,
                 "unit" : unit_dropdown,
+                "range" : range_button,
+                "stop" : stop_field,
+                "steps" : steps_field,
             }
 
-            def handleToggle(state, input_field=input_field, unit_dropdown=unit_dropdown):
+            def handleToggle(state, input_field=input_field, unit_dropdown=unit_dropdown, range_widgets=(range_button, stop_field, steps_field)):
                 input_field.setEnabled(state)
                 if unit_dropdown:
                     unit_dropdown.setEnabled(state)
+                for widget in range_widgets:
+                    widget.setEnabled(state)
 
             # Checkbox signal
             checkbox.toggled.connect(lambda _: self.checkboxToggled.emit())
@@ -163,6 +199,8 @@ class InputWidget(QWidget):
             input_field.setEnabled(False)
             if unit_dropdown:
                 unit_dropdown.setEnabled(False)
+            for widget in (range_button, stop_field, steps_field):
+                widget.setEnabled(False)
 
             self.row += 1
 
@@ -170,14 +208,14 @@ class InputWidget(QWidget):
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
         separator.setFrameShadow(QFrame.Shadow.Sunken)
-        self.layout.addWidget(separator, self.row, 0, 1, 5)
+        self.layout.addWidget(separator, self.row, 0, 1, 8)
         self.row += 1
 
     #---------------------------------------------
     # Get checked variables data
     #---------------------------------------------
     def getCheckedData(self):
-        """Return a dict of checked variables with their values and units."""
+        """Return a dict of checked variables with their values and units, range values as arrays."""
         checked_data = {}
         for name, widgets in self.fieldValues.items():
             checkbox = widgets["checkbox"]
@@ -192,9 +230,22 @@ class InputWidget(QWidget):
                     try:
                         value = np.float64(raw_value)
                     except ValueError:
-                        print(f"[Warning] Invalid numeric input for {name!r}: {raw_value}")
+                        logger.warning("Invalid numeric input for %r: %s", name, raw_value)
                         continue
 
+                # Range mode, start / stop / steps
+                if widgets["range"].isChecked() and value is not None:
+                    try:
+                        stop = np.float64(widgets["stop"].text().strip())
+                        steps = int(widgets["steps"].text().strip())
+                    except ValueError:
+                        logger.warning("Invalid range for %r", name)
+                        continue
+                    if steps < 2:
+                        logger.warning("Range for %r needs at least 2 steps", name)
+                        continue
+                    value = np.linspace(value, stop, steps)
+
                 unit_dropdown = widgets["unit"]
                 unit = unit_dropdown.currentText() if unit_dropdown else None
 
@@ -205,6 +256,18 @@ class InputWidget(QWidget):
                     }
                 
         return checked_data
+
+    #---------------------------------------------
+    # Get field units
+    #---------------------------------------------
+    def getUnits(self):
+        """Return a dict of symbols with their selected units, None for unitless fields."""
+        units = {}
+        for name, widgets in self.fieldValues.items():
+            unit_dropdown = widgets["unit"]
+            units[widgets["symbol"]] = unit_dropdown.currentText() if unit_dropdown else None
+
+        return units
     
     #---------------------------------------------
     # Disable fields
@@ -228,11 +291,16 @@ class InputWidget(QWidget):
                 input_field = widgets["input"]
                 input_field.setEnabled(False)
 
-                # Update input text
-                if value is not None:
-                    input_field.setText(f"{value:.6g}")
-                else:
+                for key in ("range", "stop", "steps"):
+                    widgets[key].setEnabled(False)
+
+                # Update input text, sweeps show their first and last values
+                if value is None:
                     input_field.clear()
+                elif np.ndim(value) > 0:
+                    input_field.setText(f"{value[0]:.4g} … {value[-1]:.4g}")
+                else:
+                    input_field.setText(f"{value:.6g}")
 
                 # Add tooltip + styling
                 input_field.setToolTip("Derived automatically from other inputs")
@@ -261,6 +329,9 @@ class InputWidget(QWidget):
                 input_field.setEnabled(False)
                 if unit_dropdown:
                     unit_dropdown.setEnabled(False)
+
+            for key in ("range", "stop", "steps"):
+                widgets[key].setEnabled(checkbox.isChecked())
                 
 
 #---------------------------------------------
@@ -268,6 +339,7 @@ class InputWidget(QWidget):
 #---------------------------------------------
 class GlobalButtons(QWidget):
     runButtonClicked = pyqtSignal()
+    cancelButtonClicked = pyqtSignal()
 
     def __init__(self):
         super().__init__()
@@ -281,11 +353,24 @@ class GlobalButtons(QWidget):
         self.runButton.setFixedWidth(120)
         self.layout.addWidget(self.runButton)
 
-        # Run signal
+        self.cancelButton = QPushButton("Cancel", self)
+        self.cancelButton.setFixedWidth(120)
+        self.cancelButton.setEnabled(False)
+        self.layout.addWidget(self.cancelButton)
+
+        # Run / cancel signals
         self.runButton.clicked.connect(lambda: self.runButtonClicked.emit())
+        self.cancelButton.clicked.connect(lambda: self.cancelButtonClicked.emit())
 
         self.setLayout(self.layout)
 
+    #---------------------------------------------
+    # Running state
+    #---------------------------------------------
+    def setRunning(self, running):
+        """Only allow cancelling while a solve is running"""
+        self.cancelButton.setEnabled(running)
+
 
 #---------------------------------------------
 # Main window
@@ -300,7 +385,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         # Window Setup
         self.setWindowTitle("Engine Initial Variables")
-        self.resize(500, 1000)
+        self.resize(760, 1000)
 
         # Central widget
         centralWidget = QWidget()
@@ -314,6 +399,11 @@ class MainWindow(QMainWindow):
         self.inputSection = InputWidget()
         centralLayout.addWidget(self.inputSection)
 
+        # Sweep plot, shown once a range is run
+        self.sweepPlot = SweepPlot()
+        self.sweepPlot.hide()
+        centralLayout.addWidget(self.sweepPlot)
+
         # Global buttons
         self.globalButtons = GlobalButtons()
         centralLayout.addWidget(self.globalButtons)
@@ -0,0 +1,248 @@
+from PyQt6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QComboBox,
+    QLabel,
+    QSizePolicy,
+)
+from PyQt6.QtGui import (
+    QPainter,
+    QPen,
+    QColor,
+    QPolygonF,
+)
+from PyQt6.QtCore import (
+    Qt,
+    QPointF,
+    QRectF,
+)
+import numpy as np
+
+
+#---------------------------------------------
+# Min / max downsampling
+#---------------------------------------------
+def decimate(x, y, x0, x1, width):
+    """
+    Reduces a sweep to at most two points per pixel column
+
+    x must be monotonic. Each column keeps the min and max of its y values,
+    so peaks survive however many points fall in a column. Returns column x
+    positions in data units with their y minima and maxima, NaN where a
+    column holds no finite values.
+    """
+    if len(x) <= 2 * width:
+        return x, y, y
+
+    column = ((x - x0) / (x1 - x0) * (width - 1)).astype(np.int64)
+    starts = np.flatnonzero(np.r_[True, np.diff(column) != 0])
+
+    # fmin / fmax skip NaN unless the whole column is NaN
+    yMin = np.fmin.reduceat(y, starts)
+    yMax = np.fmax.reduceat(y, starts)
+
+    return x[starts], yMin, yMax
+
+
+#---------------------------------------------
+# Plot canvas
+#---------------------------------------------
+class PlotCanvas(QWidget):
+    margins = (70, 12, 16, 36)      # left, top, right, bottom
+
+    def __init__(self):
+        super().__init__()
+        self.setMinimumHeight(240)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+
+        self.x = None
+        self.y = None
+        self.xLabel = ""
+        self.yLabel = ""
+
+        # Decimated curve, rebuilt when the data or the width changes
+        self.version = 0
+        self.curveKey = None
+        self.curve = None
+
+    #---------------------------------------------
+    # Data
+    #---------------------------------------------
+    def setData(self, x, y, xLabel, yLabel):
+        """Shows y against x, both arrays of the same length"""
+        self.x, self.y = x, y
+        self.xLabel, self.yLabel = xLabel, yLabel
+        self.dataChanged()
+
+    def dataChanged(self):
+        """Called whenever the arrays were filled in further"""
+        self.version += 1
+        self.update()
+
+    def plotCurve(self, width):
+        """Decimated curve for the current data and plot width"""
+        key = (self.version, width)
+        if key != self.curveKey:
+            x0, x1 = self.x[0], self.x[-1]
+            self.curve = decimate(self.x, self.y, x0, x1, width) if x1 != x0 else (self.x, self.y, self.y)
+            self.curveKey = key
+        return self.curve
+
+    #---------------------------------------------
+    # Painting
+    #---------------------------------------------
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("white"))
+
+        left, top, right, bottom = self.margins
+        area = QRectF(left, top, self.width() - left - right, self.height() - top - bottom)
+        if area.width() < 10 or area.height() < 10:
+            return
+
+        painter.setPen(QPen(QColor("gray")))
+        painter.drawRect(area)
+
+        # Axis titles
+        painter.setPen(QPen(QColor("black")))
+        painter.drawText(QRectF(left, self.height() - 18, area.width(), 18), Qt.AlignmentFlag.AlignCenter, self.xLabel)
+        painter.save()
+        painter.translate(12, top + area.height() / 2)
+        painter.rotate(-90)
+        painter.drawText(QRectF(-area.height() / 2, -10, area.height(), 20), Qt.AlignmentFlag.AlignCenter, self.yLabel)
+        painter.restore()
+
+        if self.x is None or self.y is None or len(self.x) == 0:
+            return
+
+        xs, yMin, yMax = self.plotCurve(int(area.width()))
+
+        finite = np.isfinite(yMin) & np.isfinite(yMax)
+        if not finite.any():
+            return
+
+        x0, x1 = float(self.x[0]), float(self.x[-1])
+        y0, y1 = float(yMin[finite].min()), float(yMax[finite].max())
+        if x0 == x1:
+            x0, x1 = x0 - 0.5, x1 + 0.5
+        if y0 == y1:
+            y0, y1 = y0 - 0.5, y1 + 0.5
+
+        # Axis range labels
+        painter.drawText(QRectF(left, top + area.height() + 2, 100, 16), Qt.AlignmentFlag.AlignLeft, f"{x0:.4g}")
+        painter.drawText(QRectF(left + area.width() - 100, top + area.height() + 2, 100, 16), Qt.AlignmentFlag.AlignRight, f"{x1:.4g}")
+        painter.drawText(QRectF(0, top, left - 4, 16), Qt.AlignmentFlag.AlignRight, f"{y1:.4g}")
+        painter.drawText(QRectF(0, top + area.height() - 16, left - 4, 16), Qt.AlignmentFlag.AlignRight, f"{y0:.4g}")
+
+        # Data to pixel coordinates
+        px = area.left() + (xs - x0) / (x1 - x0) * area.width()
+        pyMin = area.bottom() - (yMin - y0) / (y1 - y0) * area.height()
+        pyMax = area.bottom() - (yMax - y0) / (y1 - y0) * area.height()
+
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(QColor("#1f77b4"), 1.5))
+
+        # One polyline per run of finite columns, each column drawn min to max
+        breaks = np.flatnonzero(np.diff(finite.astype(np.int8))) + 1
+        for run in np.split(np.arange(len(xs)), breaks):
+            if not finite[run[0]]:
+                continue
+            points = []
+            for i in run:
+                points.append(QPointF(px[i], pyMin[i]))
+                if pyMax[i] != pyMin[i]:
+                    points.append(QPointF(px[i], pyMax[i]))
+            if len(points) == 1:
+                painter.drawPoint(points[0])
+            else:
+                painter.drawPolyline(QPolygonF(points))
+
+
+#---------------------------------------------
+# Sweep plot widget
+#---------------------------------------------
+class SweepPlot(QWidget):
+    """Plots one var of a sweep against the swept input, filled in chunk by chunk"""
+
+    def __init__(self):
+        super().__init__()
+
+        self.layout = QVBoxLayout(self)
+        self.layout.setContentsMargins(10, 0, 10, 0)
+
+        # Plotted var selection and progress
+        header = QHBoxLayout()
+        header.addWidget(QLabel("Plot"))
+        self.varDropdown = QComboBox()
+        self.varDropdown.setFixedWidth(100)
+        header.addWidget(self.varDropdown)
+        header.addStretch(1)
+        self.status = QLabel("")
+        header.addWidget(self.status)
+        self.layout.addLayout(header)
+
+        self.canvas = PlotCanvas()
+        self.layout.addWidget(self.canvas)
+
+        self.data = {}
+        self.units = {}
+        self.xSymbol = None
+        self.points = 0
+        self.done = 0
+
+        self.varDropdown.currentTextChanged.connect(self.showVar)
+
+    #---------------------------------------------
+    # Sweep lifecycle
+    #---------------------------------------------
+    def startSweep(self, xSymbol, sweptVars, units):
+        """Clears the plot for a new sweep of the swept input arrays, in display units"""
+        self.xSymbol = xSymbol
+        self.units = units
+        self.points = len(sweptVars[xSymbol])
+        self.done = 0
+        self.data = {k: np.asarray(v, dtype=float) for k, v in sweptVars.items()}
+
+        self.varDropdown.blockSignals(True)
+        self.varDropdown.clear()
+        self.varDropdown.addItems([k for k in sweptVars if k != xSymbol])
+        self.varDropdown.blockSignals(False)
+
+        self.canvas.setData(None, None, "", "")
+        self.showVar(self.varDropdown.currentText())
+        self.status.setText(f"0 / {self.points}")
+        self.show()
+
+    def addChunk(self, start, derivedVars):
+        """Adds the results of one chunk, in display units"""
+        chunkLength = 0
+        for symbol, values in derivedVars.items():
+            values = np.atleast_1d(values)
+            if symbol not in self.data:
+                self.data[symbol] = np.full(self.points, np.nan)
+                self.varDropdown.addItem(symbol)
+            self.data[symbol][start:start + len(values)] = values
+            chunkLength = len(values)
+
+        self.done = min(self.points, self.done + chunkLength)
+        self.status.setText(f"{self.done} / {self.points}")
+        self.canvas.dataChanged()
+
+    def finishSweep(self, cancelled=False):
+        """Marks the sweep complete or cancelled"""
+        self.status.setText(f"{self.done} / {self.points}" + (" (cancelled)" if cancelled else ""))
+
+    #---------------------------------------------
+    # Plotted var
+    #---------------------------------------------
+    def showVar(self, symbol):
+        """Plots symbol against the swept input"""
+        if symbol not in self.data:
+            return
+
+        def label(s):
+            unit = self.units.get(s)
+            return f"{s} [{unit}]" if unit else s
+
+        self.canvas.setData(self.data[self.xSymbol], self.data[symbol], label(self.xSymbol), label(symbol))